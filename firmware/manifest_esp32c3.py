@@ -0,0 +1,22 @@
+"""Freeze manifest for a custom ESP32_GENERIC_C3 build with the controller modules baked in.
+
+Frozen modules run from flash as precompiled bytecode, so boot skips parsing
+them and their code objects and qstrs never take heap. That includes the vote
+UUIDs and command tables in `lib.consts`. Build from a MicroPython checkout:
+
+    make -C ports/esp32 BOARD=ESP32_GENERIC_C3 \
+        FROZEN_MANIFEST=/path/to/pixel-poll/firmware/manifest_esp32c3.py
+
+Then copy `main.py` to the board, plus the `typing.mpy` and
+`typing_extensions.mpy` stubs from `src/common` to the board's root directory:
+the frozen modules import `typing`, and `package("lib")` only freezes `.py`
+files (as `lib.*`, not top-level modules). Do not copy the frozen modules, or a
+`/lib` directory, as well: the filesystem comes first on `sys.path` and would
+shadow them.
+"""
+# ruff: noqa: F821  # include/freeze/package are provided by the manifest loader
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("lib", base_path="../src/controller")
+freeze("../src/controller", "ble_vote_controller.py")
@@ -0,0 +1,32 @@
+"""Freeze manifest for a custom RPI_PICO2_W build with the central modules baked in.
+
+Frozen modules run from flash as precompiled bytecode, so boot skips parsing
+them and their code objects never take heap. Build from a MicroPython checkout:
+
+    make -C ports/rp2 BOARD=RPI_PICO2_W \
+        FROZEN_MANIFEST=/path/to/pixel-poll/firmware/manifest_rp2.py
+
+Then copy `main.py` and `lcd/Robotron13x21.c` to the board, plus the
+`typing.mpy` and `typing_extensions.mpy` stubs from `src/common` to the board's
+root directory: the frozen modules import `typing`, and `package("lib")` only
+freezes `.py` files (as `lib.*`, not top-level modules). Do not copy the frozen
+modules, or a `/lib` directory, as well: the filesystem comes first on
+`sys.path` and would shadow them.
+"""
+# ruff: noqa: F821  # include/freeze/package are provided by the manifest loader
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("ui", base_path="../src/central")
+package("lcd", base_path="../src/central")
+package("encoder", base_path="../src/central")
+package("lib", base_path="../src/central")
+freeze(
+    "../src/central",
+    (
+        "ble_vote_manager.py",
+        "consts.py",
+        "hardware.py",
+        "vote_session.py",
+    ),
+)
@@ -14,21 +14,36 @@ Usage example
     asyncio.run(asyncio.sleep(60))  # keep main script alive
 """
 
+import binascii
+import time
+from array import array
 from typing import Callable
 
 import bluetooth
-from lib.consts import VOTE_NOTIFY_CHAR_UUID, VOTE_SVC_UUID, VOTE_WRITE_CHAR_UUID
+import micropython
+from lib.consts import DEBUG, VOTE_NOTIFY_CHAR_UUID, VOTE_SVC_UUID, VOTE_WRITE_CHAR_UUID
 from micropython import const
 
 _ENABLE_NOTIFY = b"\x01\x00"  # pre-packed 0x0001
 
 _VOTE_SVC_UUID_BIN = bytes(VOTE_SVC_UUID)  # type: ignore[reportAssignmentType] for fast adv-scan matching
+_VOTE_SVC_UUID_LEN = len(_VOTE_SVC_UUID_BIN)
 
 _FAST_SCAN_WIN_US = const(30_000)  # 30 ms listen time
 _FAST_SCAN_INT_US = const(60_000)  # 60 ms between starts  → 50 % duty
 _FAST_CONNECT_MS = const(5_000)  # run for 5 s
 _SLOW_SCAN_WIN_US = const(15_000)  # 15 ms listen time
 _SLOW_SCAN_INT_US = const(300_000)  # 300 ms between starts  → 5 % duty
+_CONNECT_SCAN_MS = const(2_000)  # gap_connect's own scan for the target
+_MIN_CONN_INT_US = const(7_500)  # 7.5 ms, the shortest interval BLE allows
+_MAX_CONN_INT_US = const(15_000)
+# A fast scan's own SCAN_DONE lands at its deadline; one this early is stale
+_SCAN_DONE_SLACK_MS = const(250)
+
+# What the radio was last asked to do, so repeated requests are dropped
+_SCAN_OFF = const(0)
+_SCAN_FAST = const(1)
+_SCAN_SLOW = const(2)
 
 # -------------------------------------------------
 #  BLE IRQ event codes (central side)
@@ -41,19 +56,55 @@ _IRQ_GATTC_SERVICE_RESULT = const(9)
 _IRQ_GATTC_SERVICE_DONE = const(10)
 _IRQ_GATTC_CHARACTERISTIC_RESULT = const(11)
 _IRQ_GATTC_CHARACTERISTIC_DONE = const(12)
+_IRQ_GATTC_WRITE_DONE = const(17)
 _IRQ_GATTC_NOTIFY = const(18)
 
 
-# -------------------------------------------------
-class _Peer:
-    """Book-keeping for each connected ESP32."""
+_ADV_TYPE_UUID16_INCOMPLETE = const(0x02)
+_ADV_TYPE_UUID16_COMPLETE = const(0x03)
+_ADV_TYPE_UUID128_INCOMPLETE = const(0x06)
+_ADV_TYPE_UUID128_COMPLETE = const(0x07)
+
 
-    def __init__(self, addr: bytes) -> None:
-        self.addr: bytes = addr
-        self.conn_handle: int = -1
-        self.tx_handle: memoryview[int] | None = None  # us ➜ ESP32
-        self.rx_handle: memoryview[int] | None = None  # ESP32 ➜ us
-        self.svc_range: tuple[int, int] | None = None  # (start_handle, end_handle)
+def _adv_has_service(adv: memoryview, uuid_bin: bytes, uuid_len: int) -> bool:
+    """Return True if a service-UUID list in `adv` contains `uuid_bin`.
+
+    Walks the `[len][type][value...]` AD records and only compares against the
+    16- or 128-bit service UUID lists, so bytes inside e.g. manufacturer data
+    can never cause a false match.
+    """
+    if uuid_len == 16:
+        list_types = (_ADV_TYPE_UUID128_INCOMPLETE, _ADV_TYPE_UUID128_COMPLETE)
+    else:
+        list_types = (_ADV_TYPE_UUID16_INCOMPLETE, _ADV_TYPE_UUID16_COMPLETE)
+    n = len(adv)
+    i = 0
+    while i + 1 < n:
+        length = adv[i]
+        if not length:
+            break
+        end = i + 1 + length
+        if end > n:  # truncated record
+            break
+        if adv[i + 1] in list_types:
+            for j in range(i + 2, end - uuid_len + 1, uuid_len):
+                # Byte-wise, so a mismatch (usually the first byte) never slices
+                k = 0
+                while k < uuid_len and adv[j + k] == uuid_bin[k]:
+                    k += 1
+                if k == uuid_len:
+                    return True
+        i = end
+    return False
+
+
+# Diagnostics are scheduled out of the BLE IRQ so printing never runs inside it
+def _log(args: tuple) -> None:
+    print(*args)
+
+
+def _log_connecting(addr: bytes) -> None:
+    print("Connecting to", binascii.hexlify(addr, ":").decode())
 
 
 # -------------------------------------------------
@@ -71,36 +122,164 @@ class BleVoteManager:
         ble: bluetooth.BLE | None = None,
         *,
         on_rx: Callable[[int, bytes], None] | None = None,
+        on_count_change: Callable[[int], None] | None = None,
         max_peers: int = 5,
+        min_conn_interval_us: int = _MIN_CONN_INT_US,
+        max_conn_interval_us: int = _MAX_CONN_INT_US,
     ) -> None:
         """Initialize the VoteCentral instance.
 
         Args:
             ble (bluetooth.BLE):  pass an existing bluetooth.BLE() instance, or None to create one
             on_rx (Callable[[int, bytes], None]): callback(conn_handle, payload) on every incoming notification
+            on_count_change (Callable[[int], None]): callback(num_peers) whenever a peer connects or disconnects
             max_peers (int): number of ESP32s to connect to
+            min_conn_interval_us (int): shortest connection interval to request
+            max_conn_interval_us (int): longest connection interval to request;
+                shorter intervals cut vote latency at the cost of radio time
         """
         self._ble: bluetooth.BLE = ble or bluetooth.BLE()
         self._ble.active(True)
-        self._ble.irq(self._irq)
+        # Bound methods cached once; these run from IRQ handlers and broadcast
+        self._gattc_write = self._ble.gattc_write
+        self._gap_scan = self._ble.gap_scan
 
         self._on_rx = on_rx
+        self._on_count_change = on_count_change
         self._max_peers: int = max_peers
-        self._peers: dict[int, _Peer] = {}  # conn_handle → _Peer
-        self._peer_addrs: list[bytes] = []  # addresses of connected peers
+        self._min_conn_interval_us = min_conn_interval_us
+        self._max_conn_interval_us = max_conn_interval_us
+
+        # Per-peer book-keeping as parallel arrays indexed by slot (0..max_peers-1)
+        n = max_peers
+        self._slot_addr: list[bytes | None] = [None] * n
+        self._slot_conn = array("i", [-1] * n)  # -1 marks a free slot
+        self._slot_tx = array("i", [-1] * n)  # us ➜ ESP32 value handle
+        self._slot_rx = array("i", [-1] * n)  # ESP32 ➜ us value handle
+        self._slot_cccd = array("i", [-1] * n)  # notify-enable descriptor for rx
+        self._slot_svc_start = array("H", bytes(2 * n))  # 0 until the service is found
+        self._slot_svc_end = array("H", bytes(2 * n))
+        self._slot_ready = bytearray(n)  # 1 once the peer acked its CCCD write
+        self._free_slots: list[int] = list(range(n))
+        # addr → (tx, rx, cccd) from a previous successful subscribe; the
+        # controllers' GATT table is fixed, so a reconnecting peer skips rediscovery
+        self._handle_cache: dict[bytes, tuple[int, int, int]] = {}
         self._scan_disabled = False
-        self._scan_fast_briefly()
+        self._scan_mode: int = _SCAN_OFF
+        self._fast_scan_end: int = 0  # ticks_ms deadline of the current fast scan
+        # Pending (conn_handle, msg) writes, sent one at a time so the
+        # controller's small Tx queue is never flooded
+        self._tx_queue: list[tuple[int, bytes]] = []
+        self._tx_busy_conn: int = -1  # conn_handle of the write in flight, or -1
+        self._tx_busy_handle: int = -1  # its value handle, to match WRITE_DONE
+
+        # Event code → bound handler, built once so the IRQ is a single lookup
+        self._dispatch: dict[int, Callable[[tuple], None]] = {
+            _IRQ_SCAN_RESULT: self._handle_scan_result,
+            _IRQ_SCAN_DONE: self._handle_scan_done,
+            _IRQ_PERIPHERAL_CONNECT: self._handle_peripheral_connect,
+            _IRQ_PERIPHERAL_DISCONNECT: self._handle_peripheral_disconnect,
+            _IRQ_GATTC_SERVICE_RESULT: self._handle_gattc_service_result,
+            _IRQ_GATTC_SERVICE_DONE: self._handle_gattc_service_done,
+            _IRQ_GATTC_CHARACTERISTIC_RESULT: self._handle_gattc_characteristic_result,
+            _IRQ_GATTC_CHARACTERISTIC_DONE: self._handle_gattc_characteristic_done,
+            _IRQ_GATTC_WRITE_DONE: self._handle_gattc_write_done,
+            _IRQ_GATTC_NOTIFY: self._handle_gattc_notify,
+        }
+        # Register the IRQ *after* the dispatch table exists
+        self._ble.irq(self._irq)
+        self._maybe_resume_scan(True)
 
     # -------------------------------------------------
     #  Private helpers
     # -------------------------------------------------
-    def _scan_fast_briefly(self) -> None:
-        """Scan fast for a short time to find new peers."""
-        self._ble.gap_scan(_FAST_CONNECT_MS, _FAST_SCAN_INT_US, _FAST_SCAN_WIN_US)
+    def _start_scan(self, fast: bool) -> None:
+        """Start a fast (`_FAST_CONNECT_MS`) or slow (endless) scan if not already running."""
+        mode = _SCAN_FAST if fast else _SCAN_SLOW
+        if self._scan_mode == mode:
+            return
+        # Replacing a running scan may fire SCAN_DONE for the old one, during
+        # the call or (NimBLE) after it returns; _handle_scan_done drops both
+        self._scan_mode = _SCAN_OFF
+        if fast:
+            self._fast_scan_end = time.ticks_add(time.ticks_ms(), _FAST_CONNECT_MS)
+            self._gap_scan(_FAST_CONNECT_MS, _FAST_SCAN_INT_US, _FAST_SCAN_WIN_US)
+        else:
+            self._gap_scan(0, _SLOW_SCAN_INT_US, _SLOW_SCAN_WIN_US)
+        self._scan_mode = mode
+
+    def _stop_scan(self) -> None:
+        """Stop scanning if a scan is running."""
+        if self._scan_mode == _SCAN_OFF:
+            return
+        self._scan_mode = _SCAN_OFF  # before the call, so its SCAN_DONE is ignored
+        self._gap_scan(None)  # type: ignore[reportArgumentType]
 
-    def _scan_slow_forever(self) -> None:
-        """Scan slow to find new peers."""
-        self._ble.gap_scan(0, _SLOW_SCAN_INT_US, _SLOW_SCAN_WIN_US)
+    def _maybe_resume_scan(self, fast: bool = False) -> None:
+        """Scan for new peers unless scanning is disabled.
+
+        A truthy `fast` scans at a high duty cycle for `_FAST_CONNECT_MS`; otherwise
+        scan slowly forever.
+        """
+        if not self._scan_disabled:
+            self._start_scan(fast)
+
+    def _find_slot(self, conn_handle: int) -> int:
+        """Return the slot holding `conn_handle`, or -1 if it is not connected."""
+        slot_conn = self._slot_conn
+        for i in range(self._max_peers):
+            if slot_conn[i] == conn_handle:
+                return i
+        return -1
+
+    def _is_connected(self, addr: memoryview) -> bool:
+        """Return True if a slot already holds the peer at `addr`."""
+        # Stored bytes on the left: they compare against the scan's memoryview
+        for a in self._slot_addr:
+            if a == addr:
+                return True
+        return False
+
+    def _clear_slot(self, s: int) -> None:
+        """Reset slot `s` and return it to the free list."""
+        self._slot_addr[s] = None
+        self._slot_conn[s] = -1
+        self._slot_tx[s] = -1
+        self._slot_rx[s] = -1
+        self._slot_cccd[s] = -1
+        self._slot_svc_start[s] = 0
+        self._slot_svc_end[s] = 0
+        self._slot_ready[s] = 0
+        self._free_slots.append(s)
+
+    def _subscribe(self, conn_handle: int, s: int) -> None:
+        """Enable notifications on slot `s` and go back to looking for peers."""
+        # Enable notifications: write 0x0001 to the CCCD. This stays a write
+        # request (1): peripherals reject CCCD updates sent as write commands.
+        # The slot only takes queued writes once this one is acknowledged.
+        self._gattc_write(conn_handle, self._slot_cccd[s], _ENABLE_NOTIFY, 1)
+        if DEBUG:
+            micropython.schedule(_log, ("Subscribed to", conn_handle))
+        # Resume scanning if we need more peers
+        self._scan_disabled = False
+        if self._free_slots:
+            self._maybe_resume_scan(True)
+
+    def _pump_tx(self) -> None:
+        """Start the next queued write if none is in flight."""
+        while self._tx_busy_conn < 0 and self._tx_queue:
+            conn_handle, msg = self._tx_queue.pop(0)
+            s = self._find_slot(conn_handle)
+            if s < 0 or not self._slot_ready[s]:
+                continue  # peer went away (or never subscribed) while queued
+            tx = self._slot_tx[s]
+            try:
+                # write with response (1); the next write goes out on WRITE_DONE
+                self._gattc_write(conn_handle, tx, msg, 1)
+            except OSError:
+                continue  # link dropped; try the next write
+            self._tx_busy_conn = conn_handle
+            self._tx_busy_handle = tx
 
     # -------------------------------------------------
     #  Public helpers
@@ -108,101 +287,170 @@ class BleVoteManager:
     @property
     def num_peers(self) -> int:
         """Return the number of connected peers."""
-        return len(self._peers)
+        return self._max_peers - len(self._free_slots)
+
+    @property
+    def max_peers(self) -> int:
+        """Return the number of peer slots."""
+        return self._max_peers
+
+    def slot_of(self, conn_handle: int) -> int:
+        """Return the slot (0..max_peers-1) of a connected peer, or -1."""
+        return self._find_slot(conn_handle)
 
     def set_on_rx(self, on_rx: Callable[[int, bytes], None]) -> None:
         """Set the callback for incoming notifications."""
         self._on_rx = on_rx
 
+    def set_on_count_change(self, on_count_change: Callable[[int], None]) -> None:
+        """Set the callback for changes in the number of connected peers."""
+        self._on_count_change = on_count_change
+
     def stop_scanning(self) -> None:
         """Stop scanning for new peers."""
         self._scan_disabled = True
-        self._ble.gap_scan(None)  # type: ignore[reportArgumentType]
+        self._stop_scan()
 
     def resume_scanning(self) -> None:
         """Resume scanning for new peers."""
         self._scan_disabled = False
-        self._scan_slow_forever()
+        self._maybe_resume_scan()
 
     def send(self, conn_handle: int, msg: bytes) -> None:
-        """Write a command to a single ESP32 (does NOT await a response)."""
-        peer = self._peers.get(conn_handle)
-        if not peer or peer.tx_handle is None:
-            return
-        # write with response (1) to the tx_handle
-        self._ble.gattc_write(conn_handle, peer.tx_handle, msg, 1)  # type: ignore[reportArgumentType]
+        """Queue a command for a single ESP32 (does NOT await a response)."""
+        self._tx_queue.append((conn_handle, msg))
+        self._pump_tx()
+
+    def send_batch(self, pairs: list[tuple[int, bytes]]) -> None:
+        """Queue several (conn_handle, msg) commands and start sending once."""
+        self._tx_queue.extend(pairs)
+        self._pump_tx()
 
     def broadcast(self, msg: bytes) -> None:
-        """Write the same command to every connected ESP32."""
-        for ch in list(self._peers):
-            self.send(ch, msg)
+        """Queue the same command for every connected ESP32."""
+        # Walk the slot arrays in place; only subscribed peers are ready
+        slot_conn = self._slot_conn
+        slot_ready = self._slot_ready
+        tx_queue = self._tx_queue
+        for i in range(self._max_peers):
+            if slot_ready[i]:
+                tx_queue.append((slot_conn[i], msg))
+        self._pump_tx()
 
     # -------------------------------------------------
     #  Internal: BLE event handler
     # -------------------------------------------------
+    def _handle_scan_done(self, data: tuple) -> None:
+        # Only the end of a fast window matters; a finished fast scan drops to
+        # slow. A SCAN_DONE well before the deadline belongs to a replaced scan.
+        if self._scan_mode != _SCAN_FAST:
+            return
+        if time.ticks_diff(time.ticks_ms(), self._fast_scan_end) > -_SCAN_DONE_SLACK_MS:
+            self._scan_mode = _SCAN_OFF
+            self._maybe_resume_scan()
+
     def _handle_scan_result(self, data: tuple) -> None:
+        # Cheapest checks first: a full manager never needs to look at the payload
+        if not self._free_slots:
+            return
         addr_type, addr, adv_type, rssi, adv_data = data
-        if (
-            len(self._peers) < self._max_peers
-            and _VOTE_SVC_UUID_BIN in bytes(adv_data)
-            and addr not in self._peer_addrs
-        ):
-            # Stop scanning momentarily to init
-            self._scan_disabled = True
-            self._ble.gap_scan(None)  # type: ignore[reportArgumentType] stop scanning
-            self._ble.gap_connect(addr_type, addr)  # Non-blocking
-            print("Connecting to", self._addr_hex(addr))
-
-    def _handle_scan_done(self) -> None:
-        if not self._scan_disabled:
-            self._scan_slow_forever()
+        if self._is_connected(addr):
+            return
+        if not _adv_has_service(adv_data, _VOTE_SVC_UUID_BIN, _VOTE_SVC_UUID_LEN):
+            return
+        # Stop scanning momentarily to init
+        self._scan_disabled = True
+        self._stop_scan()
+        self._ble.gap_connect(  # Non-blocking
+            addr_type,
+            addr,
+            _CONNECT_SCAN_MS,
+            self._min_conn_interval_us,
+            self._max_conn_interval_us,
+        )
+        if DEBUG:
+            micropython.schedule(_log_connecting, bytes(addr))
 
     def _handle_peripheral_connect(self, data: tuple) -> None:
         conn_handle, addr_type, addr = data
-        peer = _Peer(bytes(addr))
-        peer.conn_handle = conn_handle
-        self._peers[conn_handle] = peer
-        self._peer_addrs.append(bytes(addr))
-        print("Connected", conn_handle)
+        if not self._free_slots:  # raced past the scan-time check
+            self._ble.gap_disconnect(conn_handle)
+            return
+        s = self._free_slots.pop()
+        addr = bytes(addr)
+        self._slot_addr[s] = addr
+        self._slot_conn[s] = conn_handle
+        if self._on_count_change:
+            self._on_count_change(self.num_peers)
+        if DEBUG:
+            micropython.schedule(_log, ("Connected", conn_handle))
+        cached = self._handle_cache.get(addr)
+        if cached:
+            self._slot_tx[s], self._slot_rx[s], self._slot_cccd[s] = cached
+            self._subscribe(conn_handle, s)
+            return
         # Discover Vote service
         self._ble.gattc_discover_services(conn_handle)
 
     def _handle_gattc_service_result(self, data: tuple) -> None:
         conn_handle, start_handle, end_handle, uuid = data
-        if uuid == VOTE_SVC_UUID:
-            self._peers[conn_handle].svc_range = (start_handle, end_handle)
+        s = self._find_slot(conn_handle)
+        if s >= 0 and uuid == VOTE_SVC_UUID:
+            self._slot_svc_start[s] = start_handle
+            self._slot_svc_end[s] = end_handle
 
     def _handle_gattc_service_done(self, data: tuple) -> None:
         conn_handle, status = data
-        peer = self._peers.get(conn_handle)
-        if not peer or status != 0 or peer.svc_range is None:
+        s = self._find_slot(conn_handle)
+        if s < 0 or status != 0 or not self._slot_svc_start[s]:
             return
-        start, end = peer.svc_range
-        self._ble.gattc_discover_characteristics(conn_handle, start, end)
+        self._ble.gattc_discover_characteristics(
+            conn_handle, self._slot_svc_start[s], self._slot_svc_end[s]
+        )
 
     def _handle_gattc_characteristic_result(self, data: tuple) -> None:
         conn_handle, def_handle, value_handle, properties, uuid = data
-        peer = self._peers.get(conn_handle)
-        if not peer:
+        s = self._find_slot(conn_handle)
+        if s < 0:
             return
         if uuid == VOTE_NOTIFY_CHAR_UUID:
-            peer.rx_handle = value_handle
+            self._slot_rx[s] = value_handle
+            self._slot_cccd[s] = value_handle + 1  # CCCD directly follows the value
         elif uuid == VOTE_WRITE_CHAR_UUID:
-            peer.tx_handle = value_handle
+            self._slot_tx[s] = value_handle
 
     def _handle_gattc_characteristic_done(self, data: tuple) -> None:
         conn_handle, status = data
-        peer = self._peers.get(conn_handle)
-        if not peer or status != 0 or peer.rx_handle is None:
+        s = self._find_slot(conn_handle)
+        if s < 0 or status != 0 or self._slot_cccd[s] < 0:
             return
-        # Enable notifications: write 0x0001 to CCCD (rx_handle + 1)
-        cccd = peer.rx_handle + 1  # type: ignore[reportOperatorIssue]
-        self._ble.gattc_write(conn_handle, cccd, _ENABLE_NOTIFY, 1)
-        print("Subscribed to", conn_handle)
-        # Resume scanning if we need more peers
-        self._scan_disabled = False
-        if len(self._peers) < self._max_peers:
-            self._scan_fast_briefly()
+        self._subscribe(conn_handle, s)
+
+    def _handle_gattc_write_done(self, data: tuple) -> None:
+        conn_handle, value_handle, status = data
+        s = self._find_slot(conn_handle)
+        if s >= 0 and value_handle == self._slot_cccd[s]:
+            # The subscribe, which never holds the tx slot
+            addr = self._slot_addr[s]
+            if status == 0:
+                self._slot_ready[s] = 1
+                self._handle_cache[addr] = (  # type: ignore[reportArgumentType]
+                    self._slot_tx[s],
+                    self._slot_rx[s],
+                    value_handle,
+                )
+            elif self._handle_cache.pop(addr, None):  # type: ignore[reportArgumentType]
+                # Cached handles are stale: forget them and discover afresh
+                self._slot_tx[s] = self._slot_rx[s] = self._slot_cccd[s] = -1
+                self._slot_svc_start[s] = self._slot_svc_end[s] = 0
+                self._ble.gattc_discover_services(conn_handle)
+            else:
+                # Freshly discovered handles were refused; reconnect from scratch
+                self._ble.gap_disconnect(conn_handle)
+            return
+        if conn_handle == self._tx_busy_conn and value_handle == self._tx_busy_handle:
+            self._tx_busy_conn = self._tx_busy_handle = -1
+            self._pump_tx()
 
     def _handle_gattc_notify(self, data: tuple) -> None:
         conn_handle, value_handle, notify_data = data
@@ -211,41 +459,23 @@ class BleVoteManager:
 
     def _handle_peripheral_disconnect(self, data: tuple) -> None:
         conn_handle, addr_type, addr = data
-        print("Disconnected", conn_handle)
-        peer = self._peers.pop(conn_handle, None)
-        if peer is not None:
-            try:
-                self._peer_addrs.remove(peer.addr)
-            except ValueError:
-                pass
+        if DEBUG:
+            micropython.schedule(_log, ("Disconnected", conn_handle))
+        s = self._find_slot(conn_handle)
+        if s >= 0:
+            self._clear_slot(s)
+            if self._on_count_change:
+                self._on_count_change(self.num_peers)
+        # A write in flight to this peer will never complete; move on
+        if conn_handle == self._tx_busy_conn:
+            self._tx_busy_conn = self._tx_busy_handle = -1
+            self._pump_tx()
         # Scan again to replace the lost link
         self._scan_disabled = False
-        self._scan_fast_briefly()
+        self._maybe_resume_scan(True)
 
     # TODO: use micropython schedule here
     def _irq(self, event: int, data: tuple) -> None:
-        if event == _IRQ_SCAN_RESULT:
-            self._handle_scan_result(data)
-        elif event == _IRQ_SCAN_DONE:
-            self._handle_scan_done()
-        elif event == _IRQ_PERIPHERAL_CONNECT:
-            self._handle_peripheral_connect(data)
-        elif event == _IRQ_GATTC_SERVICE_RESULT:
-            self._handle_gattc_service_result(data)
-        elif event == _IRQ_GATTC_SERVICE_DONE:
-            self._handle_gattc_service_done(data)
-        elif event == _IRQ_GATTC_CHARACTERISTIC_RESULT:
-            self._handle_gattc_characteristic_result(data)
-        elif event == _IRQ_GATTC_CHARACTERISTIC_DONE:
-            self._handle_gattc_characteristic_done(data)
-        elif event == _IRQ_GATTC_NOTIFY:
-            self._handle_gattc_notify(data)
-        elif event == _IRQ_PERIPHERAL_DISCONNECT:
-            self._handle_peripheral_disconnect(data)
-
-    # -------------------------------------------------
-    #  Utility
-    # -------------------------------------------------
-    @staticmethod
-    def _addr_hex(addr: bytes) -> str:
-        return ":".join(f"{b:02X}" for b in addr)
+        handler = self._dispatch.get(event)
+        if handler:
+            handler(data)
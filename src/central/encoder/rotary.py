@@ -55,30 +55,28 @@ _transition_table_half_step = [
     [_R_START, _R_START, _R_START, _R_START],
 ]
 
+# Flattened copies indexed by `(state << 2) | clk_dt_pins`: one bytes subscript per edge
+_TT = bytes(_transition_table[s][p] for s in range(8) for p in range(4))
+_TT_HALF_STEP = bytes(
+    _transition_table_half_step[s][p] for s in range(8) for p in range(4)
+)
+
 _STATE_MASK = const(0x07)
 _DIR_MASK = const(0x30)
 
 
-def _wrap(value: int, incr: int, lower_bound: int, upper_bound: int) -> int:
-    range = upper_bound - lower_bound + 1
-    value = value + incr
-
-    if value < lower_bound:
-        value += range * ((lower_bound - value) // range + 1)
-
-    return lower_bound + (value - lower_bound) % range
-
-
-def _bound(value: int, incr: int, lower_bound: int, upper_bound: int) -> int:
-    return min(upper_bound, max(lower_bound, value + incr))
+# Range modes, module-level so the IRQ compares against folded constants
+_RANGE_UNBOUNDED = const(1)
+_RANGE_WRAP = const(2)
+_RANGE_BOUNDED = const(3)
 
 
 class Rotary:
     """Rotary encoder class."""
 
-    RANGE_UNBOUNDED = const(1)
-    RANGE_WRAP = const(2)
-    RANGE_BOUNDED = const(3)
+    RANGE_UNBOUNDED = _RANGE_UNBOUNDED
+    RANGE_WRAP = _RANGE_WRAP
+    RANGE_BOUNDED = _RANGE_BOUNDED
 
     def __init__(
         self,
@@ -101,6 +99,7 @@ class Rotary:
         self._half_step = half_step
         self._invert = invert
         self._listener = []
+        self._has_listener: bool = False  # cached so the IRQ skips an empty list
 
     def set(
         self,
@@ -148,12 +147,14 @@ class Rotary:
     def add_listener(self, listener: Callable) -> None:
         """Add a listener that will be called when the rotary encoder value changes."""
         self._listener.append(listener)
+        self._has_listener = True
 
     def remove_listener(self, listener: Callable) -> None:
         """Remove a listener."""
         if listener not in self._listener:
             raise ValueError(f'{listener} is not an installed listener')
         self._listener.remove(listener)
+        self._has_listener = bool(self._listener)
 
     def _process_rotary_pins(self, _: Pin) -> None:
         """Process the rotary encoder pins to update the value."""
@@ -164,12 +165,8 @@ class Rotary:
             clk_dt_pins = ~clk_dt_pins & 0x03
 
         # Determine next state
-        if self._half_step:
-            self._state = _transition_table_half_step[self._state & _STATE_MASK][
-                clk_dt_pins
-            ]
-        else:
-            self._state = _transition_table[self._state & _STATE_MASK][clk_dt_pins]
+        table = _TT_HALF_STEP if self._half_step else _TT
+        self._state = table[((self._state & _STATE_MASK) << 2) | clk_dt_pins]
         direction = self._state & _DIR_MASK
 
         incr = 0
@@ -180,19 +177,25 @@ class Rotary:
 
         incr *= self._reverse
 
-        if self._range_mode == self.RANGE_WRAP:
-            self._value = _wrap(self._value, incr, self._min_val, self._max_val)
-        elif self._range_mode == self.RANGE_BOUNDED:
-            self._value = _bound(self._value, incr, self._min_val, self._max_val)
-        else:
-            self._value = self._value + incr
-
-        try:
-            if old_value != self._value and len(self._listener) != 0:
+        # Clamp/wrap inline rather than calling a helper per edge
+        value = self._value + incr
+        mode = self._range_mode
+        if mode == _RANGE_BOUNDED:
+            if value < self._min_val:
+                value = self._min_val
+            elif value > self._max_val:
+                value = self._max_val
+        elif mode == _RANGE_WRAP:
+            span = self._max_val - self._min_val + 1
+            value = self._min_val + (value - self._min_val) % span
+        self._value = value
+
+        if self._has_listener and old_value != value:
+            try:
                 self._trigger()
-        except Exception:
-            # Handle exceptions in listener callbacks gracefully
-            pass
+            except Exception:
+                # Handle exceptions in listener callbacks gracefully
+                pass
 
     def _trigger(self) -> None:
         for listener in self._listener:
@@ -20,6 +20,7 @@ def init_display() -> Display:
         dc=Pin("GP7", Pin.OUT),
         cs=Pin("GP5", Pin.OUT),
         rst=Pin("GP6", Pin.OUT),
+        spi_id=0,  # stream frames over DMA
     )
 
 
@@ -46,6 +47,5 @@ def attach_encoder_navigation(enc: RotaryIRQ, router: Router) -> None:
             router.current_page.focus_next()
         elif delta < 0:
             router.current_page.focus_previous()
-        router.current_page.display()
 
     enc.add_listener(_irq)
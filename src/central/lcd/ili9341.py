@@ -1,13 +1,27 @@
 """ILI9341 LCD/Touch module adapted from https://github.com/rdagger/micropython-ili9341."""
 
 from math import cos, pi, radians, sin
+from os import uname
 from time import sleep
 
 from framebuf import RGB565, FrameBuffer
 from lcd.xglcd_font import XglcdFont
-from machine import SPI, Pin
+from machine import SPI, Pin, mem32
 from micropython import const
 
+try:
+    from rp2 import DMA
+except ImportError:  # not an RP2 port; block_nowait() falls back to blocking writes
+    DMA = None
+
+# PL022 SPI registers on the RP2 family, used to feed the TX FIFO from DMA
+_SSPDR = const(0x008)  # data register offset
+_SSPSR = const(0x00C)  # status register offset
+_SSPSR_BSY = const(0x10)  # set while a frame is being shifted out
+# (SPI0 base, SPI1 base, DREQ of SPI0 TX, DREQ of SPI1 TX) per chip
+_RP2040_SPI = (0x4003C000, 0x40040000, 16, 18)
+_RP2350_SPI = (0x40080000, 0x40088000, 24, 26)
+
 
 def color565(r: int, g: int, b: int) -> int:
     """Return RGB565 color value.
@@ -110,6 +124,7 @@ class Display:
         gamma: bool = True,
         x_offset: int = 0,
         y_offset: int = 0,
+        spi_id: int | None = None,
     ):
         """Initialize OLED.
 
@@ -126,6 +141,8 @@ class Display:
             gamma (Optional bool): Custom gamma correction (default True)
             x_offset (Optional int): X-axis origin offset (default 0)
             y_offset (Optional int): Y-axis origin offset (default 0)
+            spi_id (Optional int): Hardware SPI instance behind `spi`. On RP2
+                boards this enables DMA for `block_nowait` (default None)
         """
         self.spi = spi
         self.cs = cs
@@ -143,6 +160,24 @@ class Display:
         self.offset = bool(x_offset or y_offset)
         self.x_offset = x_offset
         self.y_offset = y_offset
+        # Last address window sent, so block() can skip redundant CASET/PASET
+        self._x0 = self._x1 = self._y0 = self._y1 = -1
+        # Reused transmit buffers for command bytes and window coordinates
+        self._cmd_buf = bytearray(1)
+        self._win_buf = bytearray(4)
+
+        # Optional DMA channel streaming pixel data into the SPI TX FIFO
+        self._dma = None
+        self._dma_busy = False
+        if DMA is not None and spi_id is not None:
+            regs = _RP2350_SPI if "RP2350" in uname().machine else _RP2040_SPI
+            spi_base = regs[spi_id]
+            self._dma = DMA()
+            self._dma_dst = spi_base + _SSPDR
+            self._spi_sr = spi_base + _SSPSR
+            self._dma_ctrl = self._dma.pack_ctrl(
+                size=0, inc_write=False, treq_sel=regs[2 + spi_id]
+            )
 
         # Initialize GPIO pins and set implementation specific methods
         self.cs.init(self.cs.OUT, value=1)
@@ -231,11 +266,72 @@ class Display:
             y0 += self.y_offset
             y1 += self.y_offset
 
-        self.write_cmd(self.SET_COLUMN, x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF)
-        self.write_cmd(self.SET_PAGE, y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF)
+        win = self._win_buf
+        if x0 != self._x0 or x1 != self._x1:
+            win[0] = x0 >> 8
+            win[1] = x0 & 0xFF
+            win[2] = x1 >> 8
+            win[3] = x1 & 0xFF
+            self.write_cmd(self.SET_COLUMN)
+            self.write_data(win)
+            self._x0 = x0
+            self._x1 = x1
+        if y0 != self._y0 or y1 != self._y1:
+            win[0] = y0 >> 8
+            win[1] = y0 & 0xFF
+            win[2] = y1 >> 8
+            win[3] = y1 & 0xFF
+            self.write_cmd(self.SET_PAGE)
+            self.write_data(win)
+            self._y0 = y0
+            self._y1 = y1
         self.write_cmd(self.WRITE_RAM)
         self.write_data(data)
 
+    def block_nowait(self, x0: int, y0: int, x1: int, y1: int, data: bytes) -> None:
+        """Write a block of data to display without waiting for the pixels.
+
+        With DMA available the pixel data is streamed in the background and
+        this returns as soon as the transfer has started; `data` must not be
+        modified until `wait_idle` returns. Otherwise this is `block`.
+
+        Args:
+            x0 (int):  Starting X position.
+            y0 (int):  Starting Y position.
+            x1 (int):  Ending X position.
+            y1 (int):  Ending Y position.
+            data (bytes): Data buffer to write.
+        """
+        dma = self._dma
+        if dma is None:
+            self.block(x0, y0, x1, y1, data)
+            return
+
+        self.block(x0, y0, x1, y1, b"")  # window + WRITE_RAM, no payload
+        self.dc(1)
+        self.cs(0)
+        self._dma_busy = True
+        dma.config(
+            read=data,
+            write=self._dma_dst,
+            count=len(data),
+            ctrl=self._dma_ctrl,
+            trigger=True,
+        )
+
+    def wait_idle(self) -> None:
+        """Block until a transfer started by `block_nowait` has finished."""
+        if not self._dma_busy:
+            return
+        dma = self._dma
+        while dma.active():  # type: ignore[reportOptionalMemberAccess]
+            pass
+        spi_sr = self._spi_sr
+        while mem32[spi_sr] & _SSPSR_BSY:  # let the FIFO drain onto the wire
+            pass
+        self.cs(1)
+        self._dma_busy = False
+
     def cleanup(self) -> None:
         """Clean up resources."""
         self.clear()
@@ -1038,6 +1134,7 @@ class Display:
         sleep(0.05)
         self.rst.value = True  # type: ignore[reportAttributeAccessIssue]
         sleep(0.05)
+        self._x0 = self._x1 = self._y0 = self._y1 = -1  # window lost on reset
 
     def reset_mpy(self) -> None:
         """Perform reset: Low=initialization, High=normal operation.
@@ -1048,6 +1145,7 @@ class Display:
         sleep(0.05)
         self.rst(1)
         sleep(0.05)
+        self._x0 = self._x1 = self._y0 = self._y1 = -1  # window lost on reset
 
     def scroll(self, y: int) -> None:
         """Scroll display vertically.
@@ -1094,9 +1192,13 @@ class Display:
             command (int): ILI9341 command code.
             *args (optional int): Data to transmit.
         """
+        if self._dma_busy:
+            self.wait_idle()
+        cmd_buf = self._cmd_buf
+        cmd_buf[0] = command
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([command]))
+        self.spi.write(cmd_buf)
         self.cs(1)
         # Handle any passed data
         if len(args) > 0:
@@ -1127,6 +1229,8 @@ class Display:
         Args:
             data (bytes): Data to transmit.
         """
+        if self._dma_busy:
+            self.wait_idle()
         self.dc(1)
         self.cs(0)
         self.spi.write(data)
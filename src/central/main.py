@@ -1,18 +1,22 @@
 """Main entry point for the central module."""
 
+import micropython
 import uasyncio as asyncio
+import utime
 from ble_vote_manager import BleVoteManager
 from consts import BTN_DEBOUNCE_MS, ReportingMode
 from hardware import attach_encoder_navigation, init_display, init_encoder
 from lib.consts import VoteCommand, VoteInfo
-from lib.threadsafe_queue import ThreadSafeQueue
-from lib.utils import get_db_button_irq
+from lib.spsc_ring import SpscRing
 from machine import Pin
 from ui.core import Router
 from ui.pages import build_pages
 from ui.widgets import TimeStepperPage
 from vote_session import VoteSession
 
+# Allocate buffer for hard-crash tracebacks inside IRQ
+micropython.alloc_emergency_exception_buf(100)
+
 DISPLAY = init_display()
 ENCODER, ENCODER_BTN = init_encoder()
 
@@ -24,38 +28,82 @@ attach_encoder_navigation(ENCODER, ROUTER)
 manager = BleVoteManager()
 session = VoteSession(manager, ROUTER, TIMER_STEPPER_PAGE)
 
-queue: ThreadSafeQueue = ThreadSafeQueue(16)
+queue = SpscRing(16)
+
+# Vote payload → command that reflects it back to the controller
+_INDICATE_MAP = {
+    VoteInfo.YES: VoteCommand.INDICATE_YES,
+    VoteInfo.NO: VoteCommand.INDICATE_NO,
+}
 
 
 async def consume_queue() -> None:
-    """Pull vote tuples off the ThreadSafeQueue and update session state."""
+    """Pull votes off the SpscRing and update session state."""
+    # Bind globals/attributes once; each use below is then a local load
+    get = queue.get
+    get_sync = queue.get_sync
+    empty = queue.empty
+    sess = session
+    record_vote = session.record_vote
+    slot_of = manager.slot_of
+    send_batch = manager.send_batch
+    batch: list[tuple[int, bytes]] = []  # reflect-writes for the current burst
+    indicate = _INDICATE_MAP.get
+    public = ReportingMode.PUBLIC
+    indicate_none = VoteCommand.INDICATE_NONE
     while True:
-        conn_handle, payload = await queue.get()
-        session.vote_record[conn_handle] = payload
-
-        # Reflect the vote back to the peripheral if reporting is PUBLIC
-        if session.reporting_mode == ReportingMode.PUBLIC:
-            if payload == VoteInfo.YES:
-                manager.send(conn_handle, VoteCommand.INDICATE_YES)
-            elif payload == VoteInfo.NO:
-                manager.send(conn_handle, VoteCommand.INDICATE_NO)
-            else:
-                manager.send(conn_handle, VoteCommand.INDICATE_NONE)
-
-
-manager.set_on_rx(
-    lambda conn_handle, payload: queue.put_sync((conn_handle, payload))
-    if session.voting
-    else None
-)
+        conn_handle, payload = await get()
+        while True:
+            record_vote(slot_of(conn_handle), payload)
+
+            # Reflect the vote back to the peripheral if reporting is PUBLIC
+            if sess.reporting_mode == public:
+                batch.append((conn_handle, indicate(payload, indicate_none)))
+
+            # Drain the rest of a burst without a round-trip through the scheduler
+            if empty():
+                break
+            conn_handle, payload = get_sync()
+
+        # Hand the whole burst to the manager in one go
+        if batch:
+            send_batch(batch)
+            batch.clear()
+
+
+_put_vote = queue.put_sync  # bound once for the IRQ path
+
+
+def _on_rx(conn_handle: int, payload: bytes) -> None:
+    """Queue a received vote while voting is open (runs in BLE IRQ context)."""
+    if session.voting:
+        _put_vote(conn_handle, payload)
+
+
+manager.set_on_rx(_on_rx)
+manager.set_on_count_change(session.set_peer_count)
 ROUTER.set_pages(build_pages(session, TIMER_STEPPER_PAGE))
 
-ENCODER_BTN.irq(
-    trigger=Pin.IRQ_FALLING,
-    handler=get_db_button_irq(
-        session.handle_button_press, ENCODER_BTN, 0, BTN_DEBOUNCE_MS
-    ),
-)
+# The button IRQ only raises a flag; debouncing happens in `button_task`
+btn_flag = asyncio.ThreadSafeFlag()
+
+
+def _btn_irq(_: Pin) -> None:
+    btn_flag.set()
+
+
+async def button_task() -> None:
+    """Wait for button edges and forward debounced presses to the session."""
+    last = utime.ticks_add(utime.ticks_ms(), -BTN_DEBOUNCE_MS)
+    while True:
+        await btn_flag.wait()
+        now = utime.ticks_ms()
+        if utime.ticks_diff(now, last) >= BTN_DEBOUNCE_MS:
+            last = now
+            session.handle_button_press(0)
+
+
+ENCODER_BTN.irq(trigger=Pin.IRQ_FALLING, handler=_btn_irq)
 
 
 # --- uasyncio entry ---
@@ -63,6 +111,7 @@ async def _main() -> None:
     """Main entry point for the central application."""
     loop = asyncio.get_event_loop()
     loop.create_task(consume_queue())  # uses global queue
+    loop.create_task(button_task())
     ROUTER.current_page.display()
     await loop.run_forever()
 
@@ -2,7 +2,10 @@
 
 from typing import Callable, Protocol
 
+from framebuf import RGB565, FrameBuffer
 from lcd.ili9341 import Display
+from lcd.xglcd_font import XglcdFont
+from lib.consts import DEBUG
 from micropython import const
 
 BACKGROUND = const(0x0843)  # #0D1117, dark blue-gray
@@ -12,10 +15,16 @@ TEXT_SELECTED = const(0x053F)  # #1FA7FF, bright azure
 TEXT_DISABLED = const(0x73AE)  # #7A8CA4, neutral blue-gray
 
 
+def swap16(color: int) -> int:
+    """Byte-swap an RGB565 color so framebuf stores it in display (big-endian) order."""
+    return ((color & 0xFF) << 8) | (color >> 8)
+
+
 class IsRouter(Protocol):
     """Protocol for a router that can navigate between pages."""
 
     display: Display
+    canvas: FrameBuffer
     history: list[int]
 
     def show_page(self, page_ind: int) -> None:
@@ -26,6 +35,27 @@ class IsRouter(Protocol):
         """Go back to the previous page."""
         ...
 
+    def draw_text(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        font: XglcdFont,
+        color: int,
+        background: int,
+        spacing: int,
+    ) -> None:
+        """Draw landscape text into the canvas."""
+        ...
+
+    def flush(self) -> None:
+        """Send the canvas to the display."""
+        ...
+
+    def flush_rows(self, y0: int, y1: int) -> None:
+        """Send canvas rows `y0`..`y1` (inclusive) to the display."""
+        ...
+
 
 class Component:
     """Class for UI components."""
@@ -51,13 +81,25 @@ class Component:
         """Display the component."""
         raise NotImplementedError("Subclasses should implement this method.")
 
+    def draw_focus(self, *, focused: bool) -> tuple[int, int] | None:
+        """Redraw only the focus indicator into the canvas.
+
+        Returns:
+            The (first, last) canvas rows touched, or None if the component
+            cannot be updated in isolation and the page needs a full redraw.
+        """
+        return None
+
     def select(self) -> None:
         """Select the component, navigating to the next page."""
         if not self.router:
-            print("No router available to select the component.")
+            if DEBUG:
+                print("No router available to select the component.")
             return
-        while self.nextPage in self.router.history and len(self.router.history) > 1:
-            self.router.history.pop()
+        # Unwind history to just before the first visit of the target page
+        history = self.router.history
+        if self.nextPage in history:
+            del history[max(history.index(self.nextPage), 1) :]
         self.router.show_page(self.nextPage)
         self.on_select() if self.on_select else None
 
@@ -82,11 +124,14 @@ class Page:
     def display(self) -> None:
         """Display the elements of the page."""
         if not self.router:
-            print("No router available to display elements.")
+            if DEBUG:
+                print("No router available to display elements.")
             return
-        self.router.display.clear(BACKGROUND)
+        self.router.display.wait_idle()  # previous flush may still be reading the canvas
+        self.router.canvas.fill(swap16(BACKGROUND))
         for i, element in enumerate(self.elements):
             element.display(focused=i == self.focus, selected=i == self.selected)
+        self.router.flush()
 
     def select(self) -> None:
         """Select the focused element on the page."""
@@ -96,13 +141,30 @@ class Page:
         else:
             self.focus = 0  # reset focus after selection
 
+    def refocus(self, new_focus: int) -> None:
+        """Move focus to `new_focus`, redrawing only the affected outlines."""
+        old_focus = self.focus
+        self.focus = new_focus
+        router = self.router
+        if not router or new_focus == old_focus:
+            return
+
+        router.display.wait_idle()  # previous flush may still be reading the canvas
+        old_rows = self.elements[old_focus].draw_focus(focused=False)
+        new_rows = self.elements[new_focus].draw_focus(focused=True)
+        if old_rows is None or new_rows is None:
+            self.display()
+            return
+        router.flush_rows(*old_rows)
+        router.flush_rows(*new_rows)
+
     def focus_next(self) -> None:
         """Move focus to the next element on the page."""
-        self.focus = (self.focus + 1) % len(self.elements)
+        self.refocus((self.focus + 1) % len(self.elements))
 
     def focus_previous(self) -> None:
         """Move focus to the previous element on the page."""
-        self.focus = (self.focus - 1) % len(self.elements)
+        self.refocus((self.focus - 1) % len(self.elements))
 
 
 class Router:
@@ -114,28 +176,92 @@ class Router:
         self.history = [0]  # Start with the first page in history
         self.set_pages(pages)
 
+        # Widgets draw into this off-screen frame, which `flush` sends in one
+        # window write instead of a CASET/PASET/RAMWR round-trip per primitive.
+        self.framebuffer = bytearray(display.width * display.height * 2)
+        self.canvas = FrameBuffer(
+            self.framebuffer, display.width, display.height, RGB565
+        )
+
     def set_pages(self, pages: list[Page]) -> None:
         """Set the Router's pages."""
         self.pages = pages
         for page in self.pages:
             page.add_router(self)
 
+    def draw_text(
+        self,
+        x: int,
+        y: int,
+        text: str,
+        font: XglcdFont,
+        color: int,
+        background: int,
+        spacing: int,
+    ) -> None:
+        """Draw landscape text into the canvas.
+
+        Mirrors `Display.draw_text(..., landscape=True)`: glyphs run from `y`
+        towards the top of the portrait frame.
+        """
+        canvas = self.canvas
+        bg = swap16(background)
+        for letter in text:
+            buf, w, h = font.get_letter(letter, color, background, landscape=True)
+            if w == 0:
+                return
+            y -= w
+            # Glyph bytes are already in display order, so blit them untouched
+            canvas.blit(FrameBuffer(buf, h, w, RGB565), x, y)
+            if spacing:
+                canvas.fill_rect(x, y - spacing, h, spacing, bg)
+            y -= spacing
+
+    def flush(self) -> None:
+        """Send the whole canvas to the display in a single block write.
+
+        The transfer runs in the background where DMA is available; anything
+        drawing into the canvas must call `display.wait_idle()` first.
+        """
+        display = self.display
+        display.block_nowait(
+            0, 0, display.width - 1, display.height - 1, self.framebuffer
+        )
+
+    def flush_rows(self, y0: int, y1: int) -> None:
+        """Send canvas rows `y0`..`y1` (inclusive) to the display.
+
+        Full-width rows are contiguous in the framebuffer, so they go out as
+        one slice without copying.
+        """
+        display = self.display
+        y0 = max(y0, 0)
+        y1 = min(y1, display.height - 1)
+        if y1 < y0:
+            return
+        stride = display.width * 2
+        rows = memoryview(self.framebuffer)[y0 * stride : (y1 + 1) * stride]
+        display.block_nowait(0, y0, display.width - 1, y1, rows)
+
     def show_page(self, page_ind: int) -> None:
         """Show a page by its index and update history."""
         if page_ind < 0 or page_ind >= len(self.pages):
             raise IndexError("Page index out of range")
 
         self.history.append(page_ind)
-        print(f"Showing page: {page_ind}")
+        if DEBUG:
+            print(f"Showing page: {page_ind}")
 
     def go_back(self) -> None:
         """Go back to the previous page in history."""
         if len(self.history) <= 1:
-            print("No history to go back to.")
+            if DEBUG:
+                print("No history to go back to.")
             return
 
         self.history.pop()
-        print(f"Going back to page: {self.history[-1]}")
+        if DEBUG:
+            print(f"Going back to page: {self.history[-1]}")
 
     @property
     def current_page(self) -> Page:
@@ -2,12 +2,20 @@
 
 from consts import ReportingMode, TimingMode
 from ui.core import Page
-from ui.widgets import TimeStepperPage, get_page
+from ui.widgets import Card, TimeStepperPage, get_page
 from vote_session import VoteSession
 
 
 def build_pages(session: VoteSession, timer_pg: TimeStepperPage) -> list[Page]:
     """Build the pages for the UI."""
+    voting_page = get_page(
+        [(7, session.voting_screen_lines, session.end)], with_back_button=False
+    )
+    voting_card = voting_page.elements[0]
+    if not isinstance(voting_card, Card):
+        raise TypeError("voting page must start with a Card")
+    session.voting_card = voting_card
+
     return [
         get_page(
             [(5, ["Start"], session.spawn), (1, ["Settings"], None)],
@@ -40,9 +48,7 @@ def build_pages(session: VoteSession, timer_pg: TimeStepperPage) -> list[Page]:
         ),
         timer_pg,
         get_page([(6, ["Right: Yes", "Left: No"], None)], with_back_button=False),
-        get_page(
-            [(7, session.voting_screen_lines, session.end)], with_back_button=False
-        ),
+        voting_page,
         get_page(
             [(0, session.voting_results_screen_lines, session.reset)],
             with_back_button=False,
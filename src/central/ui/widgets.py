@@ -2,7 +2,9 @@
 
 from typing import Callable
 
+import micropython
 from lcd.xglcd_font import XglcdFont
+from lib.consts import DEBUG
 from micropython import const
 from ui.core import (
     BACKGROUND,
@@ -11,8 +13,13 @@ from ui.core import (
     TEXT_SELECTED,
     Component,
     Page,
+    swap16,
 )
 
+# Colors byte-swapped into the canvas' big-endian pixel order
+_FOCUS_OUTLINE_FB = swap16(FOCUS_OUTLINE)
+_BACKGROUND_FB = swap16(BACKGROUND)
+
 _DISP_WIDTH = const(320)
 _DISP_HEIGHT = const(240)
 
@@ -22,6 +29,7 @@ _LETTER_SPACING = const(1)  # Spacing between letters in pixels
 _LINE_SPACING = const(2)  # Spacing between lines in pixels
 _PADDING_X = const(10)  # Padding on the left and right of the card
 _PADDING_Y = const(10)  # Padding on the top and bottom of the card
+_LINE_HEIGHT = const(_FONT_HEIGHT + _LINE_SPACING)
 
 
 class Card(Component):
@@ -51,71 +59,124 @@ class Card(Component):
         self.height = height
         self.lines = lines
 
-    def _get_as_portrait(self, x: int, y: int) -> tuple[int, int]:
-        """Convert landscape coordinates (x, y) to portrait coordinates."""
-        if not self.router:
-            print("No router available to display the card.")
-            return (-1, -1)
-        return y, _DISP_WIDTH - x
+        # Twice the card's centre; (span - extent) // 2 is where centred content starts
+        self._x_span = 2 * x + width
+        self._y_span = 2 * y + height
+
+        # Derived layout, rebuilt only when `lines` change (see `_build_layout`)
+        self._layout_dirty = True
+        self._layout_lines: list[str] = []  # snapshot the layout was built from
+        self._layout: list[tuple[str, int, int]] = []  # (text, portrait x, y)
+        self._widths: list[int] = []  # pixel width of each laid-out line
+        self._text_height = 0
+        self._start_y = 0
+        self._outline: tuple[int, int, int, int] = (0, 0, 0, 0)  # x, y, w, h
+
+    def invalidate(self) -> None:
+        """Force the layout to be rebuilt on the next `display`.
+
+        In-place edits to `lines` are also detected on their own by comparing
+        against the snapshot the layout was built from.
+        """
+        self._layout_dirty = True
+
+    def invalidate_line(self, idx: int) -> None:
+        """Re-layout only line `idx` after it was replaced in `lines`."""
+        if self._layout_dirty or len(self.lines) != len(self._layout_lines):
+            self._layout_dirty = True  # line count changed; needs a full rebuild
+            return
+        self._layout_line(idx)
+        self._layout_lines[idx] = self.lines[idx]
+        self._update_outline()
+
+    def _build_layout(self) -> None:
+        """Compute text positions and the outline for the current `lines`."""
+        num_lines = len(self.lines)
+        self._text_height = num_lines * _LINE_HEIGHT - _LINE_SPACING
+
+        # Y-position of the first line so that the block of lines is vertically centred
+        self._start_y = (self._y_span - self._text_height) // 2
+
+        self._layout = [("", 0, 0)] * num_lines
+        self._widths = [0] * num_lines
+        for idx in range(num_lines):
+            self._layout_line(idx)
+        self._layout_lines = list(self.lines)
+        self._update_outline()
+        self._layout_dirty = False
+
+    @micropython.native
+    def _layout_line(self, idx: int) -> None:
+        """Store the uppercase text, width, and portrait position of line `idx`."""
+        line = self.lines[idx]
+        if isinstance(line, list):
+            # If the line is a list, join it into a single string
+            clean = "".join(line).upper()
+        else:
+            # Otherwise, treat it as a single string
+            clean = line.upper()
+
+        # Pixel width of this line (character count × glyph width)
+        line_width = FONT.measure_text(clean, _LETTER_SPACING) - _LETTER_SPACING
+        self._widths[idx] = line_width
+
+        # X-position so the line is horizontally centred
+        start_x = (self._x_span - line_width) // 2
+
+        # Landscape (x, y) maps to portrait (y, _DISP_WIDTH - x)
+        self._layout[idx] = (
+            clean,
+            self._start_y + idx * _LINE_HEIGHT,
+            _DISP_WIDTH - start_x,
+        )
+
+    def _update_outline(self) -> None:
+        """Recompute the focus outline from the current line widths."""
+        if self._widths:
+            max_width = max(self._widths)
+            # The widest line is the one that starts furthest left
+            min_x = (self._x_span - max_width) // 2
+        else:
+            max_width = 0
+            min_x = _DISP_WIDTH
+
+        card_width = max_width + _PADDING_X * 2
+        card_height = self._text_height + _PADDING_Y * 2
+        portrait_x = self._start_y - _PADDING_Y
+        portrait_y = _DISP_WIDTH - (min_x - _PADDING_X + card_width)
+        self._outline = (portrait_x, portrait_y, card_height, card_width)
 
+    @micropython.native
     def display(self, *, focused: bool, selected: bool) -> None:
         """Display the card widget, highlighting if focused."""
         if not self.router:
-            print("No router available to display the card.")
+            if DEBUG:
+                print("No router available to display the card.")
             return
 
-        # Center-aligned text
-        line_height = FONT.height + _LINE_SPACING
-        total_text_height = len(self.lines) * line_height - _LINE_SPACING
+        if self._layout_dirty or self.lines != self._layout_lines:
+            self._build_layout()
+
+        router = self.router
+        draw_text = router.draw_text
+        font = FONT
+        color = TEXT_SELECTED if selected else TEXT_NORMAL
+        for clean, text_x, text_y in self._layout:
+            draw_text(text_x, text_y, clean, font, color, BACKGROUND, _LETTER_SPACING)
 
-        # Y-position of the first line so that the block of lines is vertically centred
-        start_y = self.y + (self.height - total_text_height) // 2
-        max_width = 0
-        min_x = _DISP_WIDTH  # start with a large value to find the minimum
-
-        for idx, line in enumerate(self.lines):
-            if isinstance(line, list):
-                # If the line is a list, join it into a single string
-                clean = "".join(line).upper()
-            else:
-                # Otherwise, treat it as a single string
-                clean = line.upper()
-
-            # Pixel width of this line (character count × glyph width)
-            line_width = FONT.measure_text(clean, _LETTER_SPACING) - _LETTER_SPACING
-            max_width = max(max_width, line_width)
-
-            # X-position so the line is horizontally centred
-            start_x = self.x + (self.width - line_width) // 2
-            min_x = min(min_x, start_x)
-
-            # Draw the line
-            text_x, text_y = self._get_as_portrait(start_x, start_y + idx * line_height)
-            self.router.display.draw_text(
-                text_x,
-                text_y,
-                clean,
-                FONT,
-                color=TEXT_NORMAL if not selected else TEXT_SELECTED,
-                background=BACKGROUND,
-                spacing=_LETTER_SPACING,
-                landscape=True,
-            )
-
-        # Card outline
-        card_width = max_width + _PADDING_X * 2
-        card_height = total_text_height + _PADDING_Y * 2
-        portrait_x, portrait_y = self._get_as_portrait(
-            min_x - _PADDING_X + card_width, start_y - _PADDING_Y
-        )
         if focused:
-            self.router.display.draw_rectangle(
-                portrait_x,
-                portrait_y,
-                card_height,
-                card_width,
-                color=FOCUS_OUTLINE,
-            )
+            x, y, w, h = self._outline
+            router.canvas.rect(x, y, w, h, _FOCUS_OUTLINE_FB)
+
+    def draw_focus(self, *, focused: bool) -> tuple[int, int] | None:
+        """Draw or erase only the focus outline, leaving the text untouched."""
+        if not self.router or self._layout_dirty or self.lines != self._layout_lines:
+            return None  # outline position is stale; needs a full redraw
+
+        x, y, w, h = self._outline
+        color = _FOCUS_OUTLINE_FB if focused else _BACKGROUND_FB
+        self.router.canvas.rect(x, y, w, h, color)
+        return y, y + h - 1
 
 
 _BACK_WIDTH = const(80)
@@ -140,7 +201,8 @@ class BackButton(Card):
     def select(self) -> None:
         """Navigate to the previous page."""
         if not self.router:
-            print("No router available to navigate back.")
+            if DEBUG:
+                print("No router available to navigate back.")
             return
         self.router.go_back()
 
@@ -188,18 +250,21 @@ def get_page(
     # Base width for every card (integer division)
     base_width = _DISP_WIDTH // num_cards
 
-    components: list[Component] = []
-
-    for idx, (next_page, lines, on_select) in enumerate(card_info):
-        # X coordinate for the left edge of this card
-        x = idx * base_width
-
-        # Make the FINAL card absorb any leftover pixels
-        width = (_DISP_WIDTH - x) if idx == num_cards - 1 else base_width
+    last_idx = num_cards - 1
 
-        components.append(
-            Card(next_page, x, 0, width, _DISP_HEIGHT, on_select=on_select, lines=lines)
+    components: list[Component] = [
+        Card(
+            next_page,
+            idx * base_width,
+            0,
+            # Make the FINAL card absorb any leftover pixels
+            (_DISP_WIDTH - idx * base_width) if idx == last_idx else base_width,
+            _DISP_HEIGHT,
+            on_select=on_select,
+            lines=lines,
         )
+        for idx, (next_page, lines, on_select) in enumerate(card_info)
+    ]
 
     if with_ok_button:
         components.append(OkButton())
@@ -210,6 +275,10 @@ def get_page(
 
 
 _TIME_DIGITS_WIDTH = const(50)
+
+# "00".."99", built once so stepping the timer never formats a string
+_TWO_DIGIT = tuple(f"{i:02}" for i in range(100))
+
 _TIME_COLON_WIDTH = const(15)
 
 
@@ -226,18 +295,27 @@ class TimeStepperPage(Page):
         left_digits_x = colon_x - _TIME_DIGITS_WIDTH
         right_digits_x = colon_x + _TIME_COLON_WIDTH
 
-        self.minutes_lines = [f"{minutes:02}"]
-        self.seconds_lines = [f"{seconds:02}"]
+        self.minutes_lines = [_TWO_DIGIT[minutes]]
+        self.seconds_lines = [_TWO_DIGIT[seconds]]
+        self._minutes_card = Card(
+            page_ind,
+            left_digits_x,
+            0,
+            _TIME_DIGITS_WIDTH,
+            _DISP_HEIGHT,
+            lines=self.minutes_lines,
+        )
+        self._seconds_card = Card(
+            page_ind,
+            right_digits_x,
+            0,
+            _TIME_DIGITS_WIDTH,
+            _DISP_HEIGHT,
+            lines=self.seconds_lines,
+        )
         super().__init__(
             [
-                Card(
-                    page_ind,
-                    left_digits_x,
-                    0,
-                    _TIME_DIGITS_WIDTH,
-                    _DISP_HEIGHT,
-                    lines=self.minutes_lines,
-                ),
+                self._minutes_card,
                 Card(
                     page_ind,
                     colon_x,
@@ -247,14 +325,7 @@ class TimeStepperPage(Page):
                     selectable=False,
                     lines=[":"],
                 ),
-                Card(
-                    page_ind,
-                    right_digits_x,
-                    0,
-                    _TIME_DIGITS_WIDTH,
-                    _DISP_HEIGHT,
-                    lines=self.seconds_lines,
-                ),
+                self._seconds_card,
                 OkButton(),
                 BackButton(),
             ],
@@ -275,17 +346,21 @@ class TimeStepperPage(Page):
         if self.focus in (3, 4):  # OkButton or BackButton
             self.focus = 0  # reset focus after selection
 
+    @micropython.native
     def update_minutes(self, inc: int) -> None:
         """Update the minutes value and display."""
         self.minutes += inc
         self.minutes %= 100  # Wrap around if minutes exceed 99
-        self.minutes_lines[0] = f"{self.minutes:02}"
+        self.minutes_lines[0] = _TWO_DIGIT[self.minutes]
+        self._minutes_card.invalidate_line(0)
 
+    @micropython.native
     def update_seconds(self, inc: int) -> None:
         """Update the seconds value and display."""
         self.seconds += inc
         self.seconds %= 60  # Wrap around if seconds exceed 59
-        self.seconds_lines[0] = f"{self.seconds:02}"
+        self.seconds_lines[0] = _TWO_DIGIT[self.seconds]
+        self._seconds_card.invalidate_line(0)
 
     def focus_next(self) -> None:
         """Move focus to the next element on the page."""
@@ -296,6 +371,7 @@ class TimeStepperPage(Page):
             self.update_minutes(1)
         elif self.selected == 2:
             self.update_seconds(1)
+        self.display()
 
     def focus_previous(self) -> None:
         """Move focus to the previous element on the page."""
@@ -306,3 +382,4 @@ class TimeStepperPage(Page):
             self.update_minutes(-1)
         elif self.selected == 2:
             self.update_seconds(-1)
+        self.display()
@@ -2,29 +2,51 @@
 
 from typing import Any
 
-import machine
 import micropython
+import uasyncio as asyncio
 from ble_vote_manager import BleVoteManager
 from consts import ELLIPSIS, ReportingMode, TimingMode
 from lib.consts import VoteCommand, VoteInfo
+from micropython import const
 from ui.core import Router
-from ui.widgets import TimeStepperPage
+from ui.widgets import Card, TimeStepperPage
 
+# Per-slot vote codes stored in `VoteSession.votes`
+VOTE_NONE = const(0)
+VOTE_YES = const(1)
+VOTE_NO = const(2)
 
-def _get_vote_results(vote_record: dict[int, int]) -> list[str]:
+# Vote payload → code stored for that peer's slot
+_VOTE_CODE = {VoteInfo.YES: VOTE_YES, VoteInfo.NO: VOTE_NO}
+
+
+def _get_vote_results(yes_count: int, no_count: int) -> list[str]:
     """Get the results of the voting."""
-    if not vote_record:
+    total = yes_count + no_count
+    if not total:
         return ["No votes"]
-    yes_count = sum(1 for v in vote_record.values() if v == VoteInfo.YES)
-    no_count = sum(1 for v in vote_record.values() if v == VoteInfo.NO)
-    return [f"Yes: {yes_count}", f"No: {no_count}", f"Total: {len(vote_record)}"]
+    return [f"Yes: {yes_count}", f"No: {no_count}", f"Total: {total}"]
+
+
+_TUTORIAL_MS = const(3000)  # pause between "Start" and the vote opening
+
+_TIME_BUF = bytearray(b"00:00")  # scratch for `_get_time_as_string`
 
 
 def _get_time_as_string(seconds: int) -> str:
-    """Get the current time as a string in MM:SS format."""
+    """Get the current time as a string in MM:SS format.
+
+    The digits are written into a shared scratch buffer, so the only
+    allocation is the final string handed to the Card.
+    """
+    buf = _TIME_BUF
     minutes = seconds // 60
-    seconds = seconds % 60
-    return f"{minutes:02}:{seconds:02}"
+    seconds -= minutes * 60
+    buf[0] = 0x30 + minutes // 10
+    buf[1] = 0x30 + minutes % 10
+    buf[3] = 0x30 + seconds // 10
+    buf[4] = 0x30 + seconds % 10
+    return str(buf, "ascii")
 
 
 class VoteSession:
@@ -44,31 +66,75 @@ class VoteSession:
         self._router = router
         self._timer_page = timer_page
 
-        self.vote_record: dict[int, int] = {}
-        self.tutorial_timer: machine.Timer | None = None
-        self.voting_timer: machine.Timer | None = None
+        # Vote code per manager slot (VOTE_NONE until that peer votes)
+        self.votes = bytearray(manager.max_peers)
+        self.votes_cast: int = 0  # slots in `votes` that are not VOTE_NONE
+        self.yes_count: int = 0  # running tallies kept by `record_vote`
+        self.no_count: int = 0
+        self.tutorial_task: asyncio.Task | None = None  # 3 s pause before start
+        self.voting_timer: asyncio.Task | None = None  # 1 s ticker task
         self.voting_time_left: int = 0
         self.voting: bool = False
+        self.peer_count: int = 0  # pushed by the manager on connect/disconnect
         self.reporting_mode: str = ReportingMode.PUBLIC
         self.timing_mode: str = TimingMode.INFINITE
 
-        # Lines used by the router pages
-        self.voting_screen_lines: list[str] = []
+        # Lines used by the router pages; mutated in place, never rebound
+        self.voting_screen_lines: list[str] = [""]
         self.voting_results_screen_lines: list[str] = []
+        self.voting_card: Card | None = None  # shows `voting_screen_lines`
+
+        # Bound methods handed to schedule, created once up front so ending
+        # or resetting a round allocates no closures
+        self._stop_cb = self._broadcast_stop
+        self._indicate_none_cb = self._broadcast_indicate_none
 
     # --------------------------------------------------------------------- #
     # Public API                                                            #
     # --------------------------------------------------------------------- #
     def handle_button_press(self, _: Any) -> None:
         """Handler for the rotary-encoder push-button."""
-        if self.tutorial_timer:
-            self.tutorial_timer.deinit()
-            self.tutorial_timer = None
+        if self.tutorial_task:
+            tutorial = self.tutorial_task
+            self.tutorial_task = None
+            try:
+                tutorial.cancel()
+            except RuntimeError:
+                pass  # pressed by the tutorial task itself; it exits on its own
             self.start()  # kick off the vote
 
         self._router.current_page.select()
         self._router.current_page.display()
 
+    def record_vote(self, slot: int, payload: bytes) -> None:
+        """Store `payload` as the vote of peer `slot`, updating the tallies.
+
+        A peer that changes its mind moves its vote between the tallies
+        rather than being counted twice.
+        """
+        code = _VOTE_CODE.get(payload, VOTE_NONE)
+        if slot < 0 or code == VOTE_NONE:
+            return
+        votes = self.votes
+        prev = votes[slot]
+        if prev == code:
+            return
+        if prev == VOTE_NONE:
+            self.votes_cast += 1
+        elif prev == VOTE_YES:
+            self.yes_count -= 1
+        else:
+            self.no_count -= 1
+        if code == VOTE_YES:
+            self.yes_count += 1
+        else:
+            self.no_count += 1
+        votes[slot] = code
+
+    def set_peer_count(self, count: int) -> None:
+        """Manager callback tracking how many controllers are connected."""
+        self.peer_count = count
+
     def set_reporting_mode(self, mode: str) -> None:
         """Page callback to switch between Public and Anonymous reporting."""
         self.reporting_mode = mode
@@ -85,12 +151,9 @@ class VoteSession:
         button was pressed (which will in turn call `self.start()`).
         """
         self._mgr.stop_scanning()
-        self.tutorial_timer = machine.Timer(
-            -1,
-            mode=machine.Timer.ONE_SHOT,
-            period=3000,
-            callback=lambda _: micropython.schedule(self.handle_button_press, 0),
-        )
+        # A task on the running loop, so `start()` and the ticker it creates
+        # run on the loop rather than from a Timer callback outside it
+        self.tutorial_task = asyncio.create_task(self._tutorial())
 
     def start(self, *_unused: int) -> None:
         """Start the voting process."""
@@ -101,39 +164,38 @@ class VoteSession:
         self.voting = True
         self.voting_time_left = self._initial_time()
 
-        self.voting_screen_lines.clear()
         if self.timing_mode == TimingMode.TIMED:
-            self.voting_screen_lines.append(_get_time_as_string(self.voting_time_left))
+            self._set_voting_line(_get_time_as_string(self.voting_time_left))
         else:
-            self.voting_screen_lines.append("Waiting")
-
-        # Periodic 1-second tick
-        self.voting_timer = machine.Timer(
-            -1,
-            mode=machine.Timer.PERIODIC,
-            period=1000,
-            callback=lambda _: self._voting_timer_tick(),
-        )
+            self._set_voting_line("Waiting")
+
+        # Periodic 1-second tick on the shared event loop (no hard-IRQ timer)
+        self.voting_timer = asyncio.create_task(self._voting_ticker())
 
     def end(self) -> None:
         """End the voting process."""
         if not self.voting_timer:
             return
 
-        self.voting_timer.deinit()
+        ticker = self.voting_timer
         self.voting_timer = None
-
-        micropython.schedule(lambda _: self._mgr.broadcast(VoteCommand.STOP), 0)
-        self.voting_results_screen_lines[:] = _get_vote_results(self.vote_record)
+        try:
+            ticker.cancel()
+        except RuntimeError:
+            pass  # ended from inside the ticker itself; it exits on its own
+
+        micropython.schedule(self._stop_cb, 0)
+        self.voting_results_screen_lines[:] = _get_vote_results(
+            self.yes_count, self.no_count
+        )
         self.voting = False
 
     def reset(self) -> None:
         """Reset the voting state and prepare for a new vote."""
-        self.vote_record.clear()
+        self.votes[:] = bytes(len(self.votes))
+        self.votes_cast = self.yes_count = self.no_count = 0
         self.voting_results_screen_lines.clear()
-        micropython.schedule(
-            lambda _: self._mgr.broadcast(VoteCommand.INDICATE_NONE), 0
-        )
+        micropython.schedule(self._indicate_none_cb, 0)
         self.voting = False
         self._mgr.resume_scanning()
 
@@ -148,9 +210,33 @@ class VoteSession:
             else 1
         )
 
-    def _scheduled_display(self, _: Any = 0) -> None:
-        """Update the display from a scheduled callback."""
-        self._router.current_page.display()
+    async def _tutorial(self) -> None:
+        """Wait out the tutorial pause, then press the button on the user's behalf."""
+        await asyncio.sleep_ms(_TUTORIAL_MS)
+        self.handle_button_press(0)
+
+    def _broadcast_stop(self, _: Any) -> None:
+        """Scheduled from `end` to tell every controller to stop voting."""
+        self._mgr.broadcast(VoteCommand.STOP)
+
+    def _broadcast_indicate_none(self, _: Any) -> None:
+        """Scheduled from `reset` to clear every controller's indicator."""
+        self._mgr.broadcast(VoteCommand.INDICATE_NONE)
+
+    def _set_voting_line(self, text: str) -> None:
+        """Replace the voting screen's line and re-layout just that line."""
+        self.voting_screen_lines[0] = text
+        if self.voting_card:
+            self.voting_card.invalidate_line(0)
+
+    async def _voting_ticker(self) -> None:
+        """Call `_voting_timer_tick` every second until this ticker is replaced."""
+        ticker = self.voting_timer
+        while True:
+            await asyncio.sleep_ms(1000)
+            if self.voting_timer is not ticker:
+                return
+            self._voting_timer_tick()
 
     def _voting_timer_tick(self) -> None:
         """Tick function for the voting timer.
@@ -158,23 +244,22 @@ class VoteSession:
         Once all votes are in or timer is done, send stop command,
         indicate none, and transition to results page.
         """
-        if self.timing_mode == TimingMode.TIMED:
+        timed = self.timing_mode == TimingMode.TIMED
+        if timed:
             self.voting_time_left -= 1
+        time_left = self.voting_time_left
 
         # End condition: timeout or every peer has voted
-        if self.voting_time_left < 0 or len(self.vote_record) == self._mgr.num_peers:
-            micropython.schedule(self.handle_button_press, 0)
+        if time_left < 0 or self.votes_cast >= self.peer_count:
+            self.handle_button_press(0)
             return
 
         # Update line 0 (count-down or animated Waiting...)
-        if self.timing_mode == TimingMode.TIMED:
-            self.voting_screen_lines[0] = _get_time_as_string(self.voting_time_left)
+        if timed:
+            self._set_voting_line(_get_time_as_string(time_left))
         else:
-            self.voting_screen_lines[0] = (
-                "Waiting"
-                if self.voting_screen_lines[0].endswith(ELLIPSIS)
-                else self.voting_screen_lines[0] + "."
-            )
-
-        # Ask router to redraw
-        micropython.schedule(self._scheduled_display, 0)
+            line = self.voting_screen_lines[0]
+            self._set_voting_line("Waiting" if line.endswith(ELLIPSIS) else line + ".")
+
+        # Redraw directly; the ticker already runs outside IRQ context
+        self._router.current_page.display()
@@ -1,6 +1,11 @@
 """Common constants used across both the central and peripheral modules."""
 
 import bluetooth
+from micropython import const
+
+# Enables diagnostic prints. Checked at runtime by importing modules (const()
+# only folds within the defining module), so leave it off outside bring-up.
+DEBUG = const(False)
 
 VOTE_SVC_UUID = bluetooth.UUID("12345678-1234-5678-1234-56789abcdef0")
 VOTE_NOTIFY_CHAR_UUID = bluetooth.UUID(
@@ -14,15 +19,15 @@ VOTE_WRITE_CHAR_UUID = bluetooth.UUID(
 class VoteCommand:
     """Enumeration for vote commands that the vote manager sends to the vote controller."""
 
-    START = bytes(0)
-    STOP = bytes(1)
-    INDICATE_YES = bytes(2)
-    INDICATE_NO = bytes(3)
-    INDICATE_NONE = bytes(4)
+    START = b"\x00"
+    STOP = b"\x01"
+    INDICATE_YES = b"\x02"
+    INDICATE_NO = b"\x03"
+    INDICATE_NONE = b"\x04"
 
 
 class VoteInfo:
     """Enumeration for vote information that the vote controller sends to the vote manager."""
 
-    YES = bytes(0)
-    NO = bytes(1)
+    YES = b"\x00"
+    NO = b"\x01"
@@ -0,0 +1,84 @@
+"""Provides SpscRing, a lock-free single-producer, single-consumer ring buffer.
+
+Each entry is a 16-bit tag (e.g. a BLE connection handle) plus an object
+reference, kept in parallel preallocated slots so that `put_sync` never
+allocates. The producer only ever writes the tail index and the consumer only
+the head index, so neither side needs a lock or a critical section.
+"""
+
+from array import array
+
+import uasyncio as asyncio
+from micropython import const
+
+_HEAD = const(0)  # index of `_idx` written only by the consumer
+_TAIL = const(1)  # index of `_idx` written only by the producer
+
+
+class SpscRing:
+    """Single-producer, single-consumer ring of (tag, item) entries."""
+
+    def __init__(self, capacity: int = 16):
+        """Initialize the empty ring.
+
+        Args:
+            capacity (int): Number of slots; a power of two no larger than 256.
+                One slot is kept free to tell full from empty.
+        """
+        if not 0 < capacity <= 256 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two no larger than 256")
+        self._mask = capacity - 1
+        self._tags = array("H", bytes(2 * capacity))
+        self._items: list = [None] * capacity
+        # Head and tail as single bytes: each store is one byte-wide write
+        self._idx = bytearray(2)
+        self._evput = asyncio.ThreadSafeFlag()  # Triggered by put, tested by get
+
+    def empty(self) -> bool:
+        """Check if the ring is empty."""
+        idx = self._idx
+        return idx[_HEAD] == idx[_TAIL]
+
+    def full(self) -> bool:
+        """Check if the ring is full."""
+        idx = self._idx
+        return ((idx[_TAIL] + 1) & self._mask) == idx[_HEAD]
+
+    def put_sync(self, tag: int, item: object) -> bool:
+        """Add an entry; safe to call from an IRQ.
+
+        Returns:
+            False if the ring was full and the entry was dropped.
+        """
+        idx = self._idx
+        tail = idx[_TAIL]
+        nxt = (tail + 1) & self._mask
+        if nxt == idx[_HEAD]:
+            return False
+        self._tags[tail] = tag
+        self._items[tail] = item
+        idx[_TAIL] = nxt  # publish only after the slot is filled
+        self._evput.set()
+        return True
+
+    def get_sync(self) -> tuple[int, object]:
+        """Remove and return the oldest (tag, item) entry."""
+        idx = self._idx
+        head = idx[_HEAD]
+        if head == idx[_TAIL]:
+            raise IndexError
+        tag = self._tags[head]
+        item = self._items[head]
+        self._items[head] = None  # drop the reference so it can be collected
+        idx[_HEAD] = (head + 1) & self._mask
+        return tag, item
+
+    async def get(self) -> tuple[int, object]:
+        """Remove and return the oldest entry, waiting for one if needed.
+
+        Usage: `tag, item = await ring.get()`
+        """
+        idx = self._idx
+        while idx[_HEAD] == idx[_TAIL]:
+            await self._evput.wait()
+        return self.get_sync()
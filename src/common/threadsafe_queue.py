@@ -5,25 +5,95 @@ Adapted from https://github.com/peterhinch/micropython-async.
 Copyright (c) 2022 Peter Hinch
 Released under the MIT License (MIT)
 
-Uses pre-allocated ring buffer: can use list or array
+Uses pre-allocated ring buffer: can use list or array, or fixed-size byte
+slots carved out of a single bytearray
+Optional pool of reusable buffers that producers borrow, fill and put by
+reference, so a message never needs a fresh allocation
 Asynchronous iterator allowing consumer to use async for
 """
 
 import asyncio
+import time
 from typing import Any
 
+import micropython
+from lib.consts import DEBUG
+from micropython import const
+
+_SPIN_US = const(50)  # back-off between polls while a blocking call waits
+
 
 class ThreadSafeQueue:  # MicroPython optimised
-    """A thread-safe queue with synchronous and asynchronous methods."""
+    """A thread-safe queue with synchronous and asynchronous methods.
+
+    Single producer, single consumer: one side only ever advances the write
+    index and the other only the read index. The wake-up flags are set only on
+    the empty → non-empty and full → non-full transitions, which relies on the
+    consumer never preempting the producer mid-put (true for an IRQ or a
+    scheduled callback feeding an asyncio task, or both sides on one loop).
+    """
+
+    def __init__(
+        self,
+        buf: int | list[Any],
+        slot_size: int | None = None,
+        pool_slot_size: int | None = None,
+        thread_safe: bool = True,
+    ):
+        """Initialize the queue with a fixed-size buffer or a pre-allocated list.
+
+        An int size is rounded up to the next power of two so indices wrap with
+        a mask instead of a modulo; a pre-allocated list must already have a
+        power-of-two length.
+
+        With `slot_size`, items are stored as raw bytes in one contiguous
+        bytearray instead of as object references. Producers must then put
+        `bytes`/`memoryview` items of exactly `slot_size` bytes, and consumers
+        get a memoryview of the slot, valid until the producer wraps round to
+        it again; copy it with `bytes()` to keep it longer.
 
-    def __init__(self, buf: int | list[Any]):
-        """Initialize the queue with a fixed-size buffer or a pre-allocated list."""
-        self._q = [0 for _ in range(buf)] if isinstance(buf, int) else buf
+        With `pool_slot_size`, one reusable buffer of that many bytes is
+        preallocated per queue entry (at most 256 entries). Producers
+        `borrow_slot()`, fill it and `put` it; consumers hand it back with
+        `return_slot()` once done.
+
+        Pass `thread_safe=False` when both ends run as tasks on the same event
+        loop: the queue then signals with plain `asyncio.Event`s, whose `set()`
+        skips the IRQ-safe poll registration. Keep the default whenever an IRQ,
+        scheduled callback or second thread puts or gets.
+        """
+        if isinstance(buf, int):
+            size = 2
+            while size < buf:  # MicroPython ints have no bit_length()
+                size <<= 1
+            buf = [0] * size
+        self._slot_size = slot_size
+        if slot_size:
+            # One memoryview per slot, built once so neither side slices at runtime
+            mv = memoryview(bytearray(slot_size * len(buf)))
+            buf = [mv[i * slot_size : (i + 1) * slot_size] for i in range(len(buf))]
+        self._q = buf
         self._size = len(self._q)
+        if self._size < 2 or self._size & (self._size - 1):
+            raise ValueError("queue size must be a power of two (at least 2)")
+        self._mask = self._size - 1
+        if pool_slot_size:
+            self._pool = [
+                memoryview(bytearray(pool_slot_size)) for _ in range(self._size)
+            ]
+            # Free pool indices as their own SPSC ring: borrow_slot (producer)
+            # only advances _fri and return_slot (consumer) only advances _fwi.
+            # Both run modulo twice the size so a full ring differs from empty.
+            self._free = bytearray(range(self._size))
+            self._fri = 0
+            self._fwi = self._size
         self._wi = 0
         self._ri = 0
-        self._evput = asyncio.ThreadSafeFlag()  # Triggered by put, tested by get
-        self._evget = asyncio.ThreadSafeFlag()  # Triggered by get, tested by put
+        # Event does not rearm on wait() like ThreadSafeFlag; waiters clear it
+        self._thread_safe = thread_safe
+        flag = asyncio.ThreadSafeFlag if thread_safe else asyncio.Event
+        self._evput = flag()  # Triggered by put, tested by get
+        self._evget = flag()  # Triggered by get, tested by put
 
     def __aiter__(self):
         """Return an asynchronous iterator for the queue."""
@@ -33,49 +103,159 @@ class ThreadSafeQueue:  # MicroPython optimised
         """Return the next item from the queue asynchronously."""
         return await self.get()
 
+    @micropython.native
     def full(self) -> bool:
         """Check if the queue is full."""
-        return ((self._wi + 1) % self._size) == self._ri
+        return ((self._wi + 1) & self._mask) == self._ri
 
+    @micropython.native
     def empty(self) -> bool:
         """Check if the queue is empty."""
         return self._ri == self._wi
 
+    @micropython.native
     def qsize(self) -> int:
         """Return the number of items in the queue."""
-        return (self._wi - self._ri) % self._size
+        return (self._wi - self._ri) & self._mask
+
+    def borrow_slot(self) -> memoryview:
+        """Take a free pool buffer to fill and put; raises IndexError if none.
+
+        Producer side only.
+        """
+        ri = self._fri
+        if ri == self._fwi:
+            raise IndexError
+        mv = self._pool[self._free[ri & self._mask]]
+        self._fri = (ri + 1) & (2 * self._size - 1)
+        return mv
 
+    def return_slot(self, mv: memoryview) -> None:
+        """Give a buffer from `borrow_slot` back to the pool.
+
+        Consumer side only.
+        """
+        pool = self._pool
+        for i in range(self._size):
+            if pool[i] is mv:
+                if DEBUG:
+                    mv[:] = bytes(len(mv))  # surface use-after-return as zeros
+                wi = self._fwi
+                self._free[wi & self._mask] = i
+                self._fwi = (wi + 1) & (2 * self._size - 1)  # publish after write
+                return
+        raise ValueError("not a pool buffer")
+
+    @micropython.native
     def get_sync(self, block: bool = False) -> Any:
         """Remove and return an item from the queue."""
         if not block and self.empty():
             raise IndexError  # Not allowed to block
         while self.empty():  # Block until an item appears
-            pass
-        r = self._q[self._ri]
-        self._ri = (self._ri + 1) % self._size
-        self._evget.set()
+            time.sleep_us(_SPIN_US)
+        ri = self._ri
+        mask = self._mask
+        was_full = ((self._wi + 1) & mask) == ri
+        r = self._q[ri]
+        self._ri = (ri + 1) & mask  # written back before the flag is set
+        if was_full:
+            self._evget.set()
         return r
 
+    @micropython.native
     def put_sync(self, v: Any, block: bool = False) -> None:
         """Add an item to the queue."""
-        self._q[self._wi] = v
-        self._evput.set()  # Schedule task waiting on get
-        if not block and self.full():
+        wi = self._wi
+        nxt = (wi + 1) & self._mask
+        if self._slot_size:
+            self._q[wi][:] = v  # copy into the slot; length must match
+        else:
+            self._q[wi] = v
+        if not block and nxt == self._ri:
             raise IndexError
-        while self.full():
-            pass  # can't bump ._wi until an item is removed
-        self._wi = (self._wi + 1) % self._size
+        while nxt == self._ri:  # can't bump ._wi until an item is removed
+            time.sleep_us(_SPIN_US)
+        was_empty = wi == self._ri
+        self._wi = nxt
+        if was_empty:
+            self._evput.set()  # Schedule task waiting on get
+
+    @micropython.native
+    def get_batch(self, max_n: int, out: list[Any]) -> int:
+        """Move up to `max_n` queued items onto the end of `out` without waiting.
+
+        The read index is advanced and the waiting producer woken once for the
+        whole run rather than once per item.
+
+        Returns:
+            The number of items moved.
+        """
+        q = self._q
+        mask = self._mask
+        ri = self._ri
+        avail = (self._wi - ri) & mask
+        n = avail if avail < max_n else max_n
+        if not n:
+            return 0
+        for _ in range(n):
+            out.append(q[ri])
+            ri = (ri + 1) & mask
+        self._ri = ri
+        if avail == mask:  # was full
+            self._evget.set()
+        return n
+
+    @micropython.native
+    def put_batch(self, seq: list[Any]) -> int:
+        """Queue as many items from `seq` as fit, without waiting.
+
+        The write index is advanced and the consumer woken once for the whole
+        run rather than once per item.
+
+        Returns:
+            The number of items queued; the rest did not fit.
+        """
+        q = self._q
+        mask = self._mask
+        ri = self._ri
+        wi = self._wi
+        slots = self._slot_size
+        n = 0
+        for v in seq:
+            nxt = (wi + 1) & mask
+            if nxt == ri:
+                break
+            if slots:
+                q[wi][:] = v
+            else:
+                q[wi] = v
+            wi = nxt
+            n += 1
+        if n:
+            was_empty = self._wi == ri
+            self._wi = wi
+            if was_empty:
+                self._evput.set()
+        return n
 
     async def get(self) -> Any:
         """Remove and return an item from the queue asynchronously.
 
         Usage: `item = await queue.get()`
         """
-        while self.empty():
-            await self._evput.wait()
-        r = self._q[self._ri]
-        self._ri = (self._ri + 1) % self._size
-        self._evget.set()  # Schedule task waiting on ._evget
+        if self._ri == self._wi:
+            evput = self._evput
+            while self._ri == self._wi:
+                await evput.wait()
+                if not self._thread_safe:
+                    evput.clear()
+        ri = self._ri
+        mask = self._mask
+        was_full = ((self._wi + 1) & mask) == ri
+        r = self._q[ri]
+        self._ri = (ri + 1) & mask
+        if was_full:
+            self._evget.set()  # Schedule task waiting on ._evget
         return r
 
     async def put(self, val: Any) -> None:
@@ -83,6 +263,9 @@ class ThreadSafeQueue:  # MicroPython optimised
 
         Usage: `await queue.put(item)`
         """
+        evget = self._evget
         while self.full():  # Queue full
-            await self._evget.wait()
+            await evget.wait()
+            if not self._thread_safe:
+                evget.clear()
         self.put_sync(val)
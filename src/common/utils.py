@@ -10,15 +10,24 @@ from machine import Pin
 def get_db_button_irq(
     callback: Callable, pin: Pin, arg: Any, debounce_ms: int
 ) -> Callable[[Pin], None]:
-    """Get a debounced IRQ handler for `pin`."""
-    last_time = 0  # captured in closure
+    """Get a debounced IRQ handler for `pin`.
+
+    Edges are ignored until a deadline `debounce_ms` after the last accepted
+    one; comparing against the deadline stays correct across tick wrap-around.
+    """
+    # Bound once here so the handler reads closure cells, not module attributes
+    ticks_ms = utime.ticks_ms
+    ticks_diff = utime.ticks_diff
+    ticks_add = utime.ticks_add
+    schedule = micropython.schedule
+    deadline = ticks_ms()  # captured in closure
 
     def irq_handler(_: Pin) -> None:
-        nonlocal last_time
-        now = utime.ticks_ms()
-        if utime.ticks_diff(now, last_time) < debounce_ms:
+        nonlocal deadline
+        now = ticks_ms()
+        if ticks_diff(deadline, now) > 0:
             return
-        last_time = now
-        micropython.schedule(callback, arg)
+        deadline = ticks_add(now, debounce_ms)
+        schedule(callback, arg)
 
     return irq_handler
@@ -15,6 +15,7 @@ Your main state machine only needs:
 """
 
 import struct
+from array import array
 from typing import Callable
 
 import bluetooth
@@ -22,6 +23,7 @@ from lib.consts import VOTE_NOTIFY_CHAR_UUID, VOTE_SVC_UUID, VOTE_WRITE_CHAR_UUI
 from micropython import const
 
 _ADV_INT_US = const(30_000)  # 30 ms advertising interval
+_MAX_CENTRALS = const(4)  # connection slots; in practice one central connects
 
 # GATT flags
 _FLAG_READ = const(0x0002)
@@ -36,22 +38,37 @@ _IRQ_GATTS_WRITE = const(3)
 
 
 # ---------- advertising helper ----------
-def _adv_payload(
-    name: bytes, services: list[bluetooth.UUID] | None = None
-) -> bytearray:
-    """Minimal advertising payload generator."""
-    payload = bytearray()
-
-    def _append(t: int, val: bytes) -> None:
-        payload.extend(struct.pack("BB", len(val) + 1, t) + val)
-
-    _append(0x01, b"\x06")  # Flags: general discoverable, BR/EDR not supported
-    _append(0x09, name)  # Complete Local Name
+_ADV_MAX_LEN = const(31)  # legacy advertising payload limit
+_ADV_BUF = bytearray(_ADV_MAX_LEN)  # scratch the payload is assembled in
+
+
+def _put_ad(buf: bytearray, off: int, t: int, val: bytes) -> int:
+    """Write one `[len][type][value]` AD record at `off` and return the next offset."""
+    n = len(val)
+    end = off + 2 + n
+    if end > _ADV_MAX_LEN:
+        raise ValueError("advertising payload too long")
+    struct.pack_into("BB", buf, off, n + 1, t)
+    buf[off + 2 : end] = val
+    return end
+
+
+def _adv_payload(name: bytes, services: list[bluetooth.UUID] | None = None) -> bytes:
+    """Minimal advertising payload generator.
+
+    AD records are packed straight into a shared scratch buffer; the only
+    allocation is the returned `bytes`, which `_advertise` then reuses.
+    """
+    buf = _ADV_BUF
+    off = _put_ad(
+        buf, 0, 0x01, b"\x06"
+    )  # Flags: general discoverable, BR/EDR not supported
+    off = _put_ad(buf, off, 0x09, name)  # Complete Local Name
     if services:
         for uuid in services:
             b = bytes(uuid)  # type: ignore[reportArgumentType]
-            _append(0x03 if len(b) == 2 else 0x07, b)
-    return payload
+            off = _put_ad(buf, off, 0x03 if len(b) == 2 else 0x07, b)
+    return bytes(memoryview(buf)[:off])
 
 
 class BleVoteController:
@@ -69,9 +86,16 @@ class BleVoteController:
 
         # Register service
         self._tx_handle, self._rx_handle = self._register_gatt()
-        self._connections: set[memoryview[int]] = set()
+        self._conns = array("h", [-1] * _MAX_CENTRALS)  # -1 marks a free slot
         self._on_rx = on_rx
 
+        # Event code → bound handler, built once so the IRQ is a single lookup
+        self._dispatch: dict[int, Callable[[tuple[memoryview[int], ...]], None]] = {
+            _IRQ_CENTRAL_CONNECT: self._handle_central_connect,
+            _IRQ_CENTRAL_DISCONNECT: self._handle_central_disconnect,
+            _IRQ_GATTS_WRITE: self._handle_gatts_write,
+        }
+
         # Set up IRQ handler *after* registry so handles are valid
         self._ble.irq(self._irq)
 
@@ -84,11 +108,15 @@ class BleVoteController:
 
     def send(self, msg: bytes) -> None:
         """Notify all connected centrals with a UTF-8 string or raw bytes."""
-        for conn in self._connections:
+        conns = self._conns
+        for i in range(_MAX_CENTRALS):
+            conn = conns[i]
+            if conn < 0:
+                continue
             try:
-                self._ble.gatts_notify(int(conn), self._tx_handle, msg)  # type: ignore[reportCallIssue]
+                self._ble.gatts_notify(conn, self._tx_handle, msg)
             except OSError:  # Link might have dropped
-                self._connections.discard(conn)
+                conns[i] = -1
 
     # ---------- Internal plumbing ----------
 
@@ -109,26 +137,37 @@ class BleVoteController:
         """Start advertising."""
         self._ble.gap_advertise(_ADV_INT_US, self._payload)
 
+    def _handle_central_connect(self, data: tuple[memoryview[int], ...]) -> None:
+        conn_handle, _, _ = data
+        conns = self._conns
+        for i in range(_MAX_CENTRALS):
+            if conns[i] < 0:
+                conns[i] = conn_handle  # type: ignore[reportArgumentType]
+                break
+        print("Central connected:", conn_handle)
+
+    def _handle_central_disconnect(self, data: tuple[memoryview[int], ...]) -> None:
+        conn_handle, _, _ = data
+        conns = self._conns
+        for i in range(_MAX_CENTRALS):
+            if conns[i] == conn_handle:
+                conns[i] = -1
+        print("Central disconnected:", conn_handle)
+        # Resume advertising so another central can connect
+        self._advertise()
+
+    def _handle_gatts_write(self, data: tuple[memoryview[int], ...]) -> None:
+        conn_handle, attr_handle = data
+        if attr_handle == self._rx_handle:
+            raw = self._ble.gatts_read(self._rx_handle)
+            if self._on_rx:
+                try:
+                    self._on_rx(raw)  # user callback
+                except Exception as e:
+                    print("RX callback error:", e)
+
     # TODO: make this safer with schedule
     def _irq(self, event: int, data: tuple[memoryview[int], ...]) -> None:
-        if event == _IRQ_CENTRAL_CONNECT:
-            conn_handle, _, _ = data
-            self._connections.add(conn_handle)
-            print("Central connected:", conn_handle)
-
-        elif event == _IRQ_CENTRAL_DISCONNECT:
-            conn_handle, _, _ = data
-            self._connections.discard(conn_handle)
-            print("Central disconnected:", conn_handle)
-            # Resume advertising so another central can connect
-            self._advertise()
-
-        elif event == _IRQ_GATTS_WRITE:
-            conn_handle, attr_handle = data
-            if attr_handle == self._rx_handle:
-                raw = self._ble.gatts_read(self._rx_handle)
-                if self._on_rx:
-                    try:
-                        self._on_rx(raw)  # user callback
-                    except Exception as e:
-                        print("RX callback error:", e)
+        handler = self._dispatch.get(event)
+        if handler:
+            handler(data)
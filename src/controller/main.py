@@ -4,7 +4,7 @@ import micropython
 import uasyncio
 from ble_vote_controller import BleVoteController
 from lib.consts import VoteCommand, VoteInfo
-from lib.threadsafe_queue import ThreadSafeQueue
+from lib.spsc_ring import SpscRing
 from lib.utils import get_db_button_irq
 from machine import Pin, Signal
 
@@ -23,15 +23,15 @@ RED_BTN = Pin(0, Pin.IN, Pin.PULL_UP)  # active-low
 GREEN_BTN = Pin(10, Pin.IN, Pin.PULL_UP)
 
 
-queue: ThreadSafeQueue  # forward declaration; filled in main()
+queue: SpscRing  # forward declaration; filled in main()
 voter: BleVoteController | None = None  # set in main()
 _DEBOUNCE_MS = micropython.const(40)  # mechanical bounce time
 
 
-async def consume_queue(q: ThreadSafeQueue) -> None:
+async def consume_queue(q: SpscRing) -> None:
     """Consume commands from the queue and update LEDs accordingly."""
     while True:
-        payload = await q.get()  # await - no busy polling
+        _, payload = await q.get()  # await - no busy polling
         if payload == VoteCommand.START:
             RED_BTN_LED.on()
             GREEN_BTN_LED.on()
@@ -55,6 +55,11 @@ async def consume_queue(q: ThreadSafeQueue) -> None:
             RIGHT_LED[2].off()
 
 
+def _on_rx(payload: bytes) -> None:
+    """BLE write callback (IRQ context): hand the command to `consume_queue`."""
+    queue.put_sync(0, payload)  # a full ring drops the command rather than block
+
+
 def _scheduled_send(vote: bytes) -> None:
     """Runs outside ISR. Sends BLE vote and resets LEDs."""
     global voter
@@ -75,12 +80,9 @@ def main() -> None:
     for pin in LEFT_LED + RIGHT_LED:
         pin.off()
 
-    queue = ThreadSafeQueue(16)
+    queue = SpscRing(16)
 
-    voter = BleVoteController(
-        name="PP Ctrl",
-        on_rx=lambda payload: queue.put_sync(payload),
-    )
+    voter = BleVoteController(name="PP Ctrl", on_rx=_on_rx)
 
     # Hook IRQs - falling edge for active-low buttons
     RED_BTN.irq(
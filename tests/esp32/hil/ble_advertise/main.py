@@ -2,11 +2,14 @@
 # Works on MicroPython v1.20+  (ESP32, RP2040-W, nRF boards)
 
 import struct
-import time
 
 import bluetooth
+import micropython
+from machine import Timer
 from micropython import const
 
+micropython.alloc_emergency_exception_buf(100)
+
 # IRQ event codes
 _IRQ_CENTRAL_CONNECT = const(1)
 _IRQ_CENTRAL_DISCONNECT = const(2)
@@ -16,7 +19,8 @@ UUID_BATTERY_SERVICE = bluetooth.UUID(0x180F)  # Battery Service
 UUID_BATTERY_LEVEL = bluetooth.UUID(0x2A19)  # Battery Level (%)
 
 # Advertised battery value
-BATTERY_LEVEL = 0x45
+BATTERY_LEVEL = const(0x45)
+_BATT_PAYLOAD = struct.pack("B", BATTERY_LEVEL)  # one unsigned byte, 0–100
 
 # Build a single-service GATT containing one readable/notifiable characteristic
 battery_level_char = (
@@ -30,12 +34,21 @@ ble.active(True)
 # Register the service and get the handle of the characteristic
 ((handle_batt_level,),) = ble.gatts_register_services((BATTERY_SERVICE,))
 
-# Write the initial value (one unsigned byte, 0–100)
-ble.gatts_write(handle_batt_level, struct.pack("B", BATTERY_LEVEL))
+# Write the initial value
+ble.gatts_write(handle_batt_level, _BATT_PAYLOAD)
+
+
+def service_ad(uuid) -> tuple:
+    """Serialize a service UUID as an (AD type, bytes) pair for `advertising_payload`."""
+    b = bytes(uuid)
+    return (0x03 if len(b) == 2 else 0x07, b)
 
 
-def advertising_payload(name: bytes, services=None) -> bytearray:
-    """Create an advertising payload with the device name and service UUIDs."""
+def advertising_payload(name: bytes, services=None) -> bytes:
+    """Create an advertising payload with the device name and service AD pairs.
+
+    `services` holds pre-serialized pairs from `service_ad`.
+    """
     payload = bytearray()
 
     def _append(ad_type, value):
@@ -46,20 +59,44 @@ def advertising_payload(name: bytes, services=None) -> bytearray:
     _append(0x09, name)  # Complete Local Name
 
     if services:
-        for uuid in services:
-            b = bytes(uuid)
-            _append(0x03 if len(b) == 2 else 0x07, b)
+        for ad_type, value in services:
+            _append(ad_type, value)
+
+    return bytes(payload)
+
+
+# Name and services never change, so the payload is built once for every advertise()
+ADV_NAME = b"MicroPyBatt"
+_BATT_SERVICE_AD = service_ad(UUID_BATTERY_SERVICE)
+_ADV_PAYLOAD = advertising_payload(ADV_NAME, (_BATT_SERVICE_AD,))
+
+
+_NOTIFY_DELAY_MS = const(200)  # give the central a moment to discover services
+_notify_timer = Timer(0)
+_notify_conn = -1  # connection to notify once the delay expires
+
+
+def _notify_batt(_):
+    """Send the battery level to the central that just connected."""
+    try:
+        ble.gatts_notify(_notify_conn, handle_batt_level, _BATT_PAYLOAD)
+    except OSError:
+        pass  # central already gone
+
 
-    return payload
+def _notify_timeout(_timer):
+    micropython.schedule(_notify_batt, 0)
 
 
 def _irq(event, data):
     """Notify the battery level when a central connects and restart advertising when it disconnects."""
+    global _notify_conn
     if event == _IRQ_CENTRAL_CONNECT:
-        conn_handle, *_ = data
-        # Give the central a moment to discover services
-        time.sleep_ms(200)
-        ble.gatts_notify(handle_batt_level, struct.pack("B", BATTERY_LEVEL))
+        # Return at once; the notify goes out from the scheduler after the delay
+        _notify_conn, *_ = data
+        _notify_timer.init(
+            mode=Timer.ONE_SHOT, period=_NOTIFY_DELAY_MS, callback=_notify_timeout
+        )
 
     elif event == _IRQ_CENTRAL_DISCONNECT:
         # Restart advertising so another device can connect
@@ -71,9 +108,8 @@ ble.irq(_irq)
 
 def advertise(interval_us=500_000):
     """Start BLE advertising with a given interval."""
-    name = b"MicroPyBatt"
-    ble.gap_advertise(interval_us, advertising_payload(name, [UUID_BATTERY_SERVICE]))
-    print("Advertising as", name.decode())
+    ble.gap_advertise(interval_us, _ADV_PAYLOAD)
+    print("Advertising as", ADV_NAME.decode())
 
 
 advertise()
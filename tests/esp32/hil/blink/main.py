@@ -1,17 +1,19 @@
-import time
-
 import neopixel
-from machine import Pin
+from machine import Pin, lightsleep
 
 PIXEL_PIN = 8  # GPIO your board uses for the NeoPixel
 NUM_PIXELS = 1  # there is only one on-board LED
 
 np = neopixel.NeoPixel(Pin(PIXEL_PIN, Pin.OUT), NUM_PIXELS)
 
+RED = (50, 0, 0)  # moderate-intensity red  (R,G,B)
+OFF = (0, 0, 0)
+
+# Light sleep between toggles instead of idling awake; nothing else runs here
 while True:
-    np[0] = (50, 0, 0)  # moderate-intensity red  (R,G,B)
+    np[0] = RED
     np.write()
-    time.sleep(0.5)
-    np[0] = (0, 0, 0)  # off
+    lightsleep(500)
+    np[0] = OFF
     np.write()
-    time.sleep(0.5)
+    lightsleep(500)
@@ -12,38 +12,41 @@ GREEN_BTN = Pin(10, Pin.IN, Pin.PULL_UP)  # active-low
 # -----------------------------------------------------
 
 
-def is_pressed(pin: Pin) -> bool:
-    """Return True when an active-low button is physically pressed."""
-    return pin.value() == 1
+# (on message, off message, LED), built once so the blink loop only does I/O
+LEDS = tuple(
+    (f"{name}: ON", f"{name}: OFF", led)
+    for name, led in (
+        [(f"LEFT[{i}]", led) for i, led in enumerate(LEFT_LED, start=1)]
+        + [(f"RIGHT[{i}]", led) for i, led in enumerate(RIGHT_LED, start=1)]
+        + [("RED_BTN_LED", RED_BTN_LED), ("GREEN_BTN_LED", GREEN_BTN_LED)]
+    )
+)
 
 
 def main() -> None:
     """Main entry point for the IO smoke test."""
-    leds = (
-        [('LEFT', i, led) for i, led in enumerate(LEFT_LED, start=1)]
-        + [('RIGHT', i, led) for i, led in enumerate(RIGHT_LED, start=1)]
-        + [('RED_BTN_LED', None, RED_BTN_LED), ('GREEN_BTN_LED', None, GREEN_BTN_LED)]
-    )
-
     for led in LEFT_LED + RIGHT_LED:
         led.off()
     print("Starting IO smoke test… (Ctrl-C to stop)\n")
 
+    last_red = last_green = -1  # forces the first report
     while True:
         # Blink LEDs one at a time
-        for group, index, led in leds:
-            name = f"{group}[{index}]" if index is not None else group
+        for on_msg, off_msg, led in LEDS:
             led.on()
-            print(f"{name}: ON")
+            print(on_msg)
             utime.sleep(0.5)
             led.off()
-            print(f"{name}: OFF")
+            print(off_msg)
             utime.sleep(0.5)
 
-            # Poll buttons once per LED cycle
-            red_state = is_pressed(RED_BTN)
-            green_state = is_pressed(GREEN_BTN)
-            print(f"Buttons — RED: {red_state}  GREEN: {green_state}\n")
+            # Poll buttons once per LED cycle, reporting only when one changes
+            red = RED_BTN.value()
+            green = GREEN_BTN.value()
+            if red != last_red or green != last_green:
+                last_red, last_green = red, green
+                # value 1 reads as pressed here
+                print(f"Buttons — RED: {red == 1}  GREEN: {green == 1}\n")
 
 
 try:
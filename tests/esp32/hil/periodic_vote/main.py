@@ -3,28 +3,34 @@ import time
 import micropython
 import neopixel
 from ble_vote_controller import BleVoteController
+from lib.consts import DEBUG
 from machine import Pin
+from micropython import const
 
 micropython.alloc_emergency_exception_buf(100)
 
-PIXEL_PIN = 8  # GPIO your board uses for the NeoPixel
-NUM_PIXELS = 1  # there is only one on-board LED
+PIXEL_PIN = const(8)  # GPIO your board uses for the NeoPixel
+NUM_PIXELS = const(1)  # there is only one on-board LED
 
 np = neopixel.NeoPixel(Pin(PIXEL_PIN, Pin.OUT), NUM_PIXELS)
 
+RED = (50, 0, 0)  # moderate-intensity red  (R,G,B)
+OFF = (0, 0, 0)
+
 on = False
 
 
 def rx_callback(payload: bytes) -> None:
     """Callback function to handle received messages."""
-    print("Received:", payload.decode('utf-8'))
+    if DEBUG:  # runs in the BLE IRQ
+        print("Received:", payload.decode('utf-8'))
     global on
     if not on:
-        np[0] = (50, 0, 0)  # moderate-intensity red  (R,G,B)
+        np[0] = RED
         np.write()
         on = True
     else:
-        np[0] = (0, 0, 0)  # off
+        np[0] = OFF
         np.write()
         on = False
 
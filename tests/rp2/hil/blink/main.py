@@ -1,9 +1,8 @@
-import time
-
 import machine
 
 led = machine.Pin("LED", machine.Pin.OUT)  # onboard LED = GP25
 
+# Light sleep between toggles instead of idling awake; nothing else runs here
 while True:
     led.toggle()
-    time.sleep(0.5)  # 500 ms
+    machine.lightsleep(500)  # 500 ms
@@ -1,15 +1,30 @@
 import time
 
+import micropython
 from encoder.rotary_irq_rp2 import RotaryIRQ
 
+# Allocate buffer for hard-crash tracebacks inside IRQ
+micropython.alloc_emergency_exception_buf(100)
+
 r = RotaryIRQ(clk_pin="GP2", dt_pin="GP3", pull_up=True)
 
 val_old = r.value()
-while True:
-    val_new = r.value()
 
+
+def _report(_) -> None:
+    """Print the new value; scheduled from the encoder IRQ."""
+    global val_old
+    val_new = r.value()
     if val_old != val_new:
         val_old = val_new
         print('result =', val_new)
 
-    time.sleep_ms(50)
+
+def _on_change() -> None:
+    micropython.schedule(_report, 0)
+
+
+# The encoder IRQ reports changes, so the main loop has nothing to poll
+r.add_listener(_on_change)
+while True:
+    time.sleep_ms(1000)
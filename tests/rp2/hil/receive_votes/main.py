@@ -3,6 +3,7 @@ import time
 import machine
 import micropython
 from ble_vote_manager import BleVoteManager
+from lib.consts import DEBUG
 
 micropython.alloc_emergency_exception_buf(100)
 
@@ -11,7 +12,8 @@ led = machine.Pin("LED", machine.Pin.OUT)  # onboard LED = GP25
 
 def got_vote(node_id: int, payload: bytes) -> None:
     """Callback function to handle received votes."""
-    print("Node", node_id, "sent", payload.decode('utf-8'))
+    if DEBUG:  # runs in the BLE IRQ
+        print("Node", node_id, "sent", payload.decode('utf-8'))
     led.toggle()
 
 
@@ -1,9 +1,14 @@
+import machine
+import micropython
 from encoder.rotary_irq_rp2 import RotaryIRQ
 from lcd.ili9341 import Display
 from machine import SPI, Pin
 from ui.core import Router
 from ui.widgets import TimeStepperPage, get_page
 
+# Allocate buffer for hard-crash tracebacks inside IRQ
+micropython.alloc_emergency_exception_buf(100)
+
 spi = SPI(
     0,
     baudrate=40_000_000,
@@ -65,7 +70,6 @@ def _encoder_callback():
         else:  # counter-clockwise rotation
             router.current_page.focus_previous()
         old_value = new_value
-        router.current_page.display()
 
 
 encoder.add_listener(_encoder_callback)
@@ -81,5 +85,6 @@ def _encoder_button_callback(pin: Pin):
 
 encoder_button.irq(trigger=Pin.IRQ_FALLING, handler=_encoder_button_callback)
 
+# Everything runs from IRQs; wait for the next one instead of spinning
 while True:
-    pass
+    machine.idle()